@@ -1,34 +1,152 @@
-from PySide2.QtWidgets import QHBoxLayout, QVBoxLayout, QFormLayout, QComboBox, QWidget, QTabWidget, QGroupBox
+from PySide2.QtWidgets import (QHBoxLayout, QVBoxLayout, QFormLayout, QComboBox, QWidget, QTabWidget, QGroupBox,
+                               QLineEdit, QListWidget, QPushButton, QCheckBox, QLabel, QCompleter)
 from PySide2.QtCore import Qt
-from PySide2.QtWebEngineWidgets import QWebEngineView
-import json
+from functools import lru_cache
+import time
 import sys, os
-module_path = os.getenv('APPDATA') + "/CET_SteelConnDesign"
 
-if not os.path.exists(module_path):
-    module_path = "../"
+# Add the plugins folder so the shared cet_common helpers can be imported
+plugins_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if plugins_path not in sys.path:
+    sys.path.append(plugins_path)
 
-# Add to sys.path
-if module_path not in sys.path:
-    sys.path.insert(0, module_path)
+from cet_common.aisc import DERIVED_UNITS, GRADES, derived_columns, family_columns
+from cet_common.export import export_rows, export_with_dialog
+from cet_common.member_properties import TEXT_FIELDS, export_fields, format_value, open_section_service
+from cet_common.qt_worker import CoalescingEvaluator
+from cet_common.render_cache import RenderCache
+from cet_common.section_models import SectionListModel, section_list_model
+from cet_common.symbols import SYMBOL_CSS, plain_symbol, render_symbol
+from cet_common.web_bridge import LazyWebView, PageBridge
 
-# Import your module
+# Section search runs on the exported shape database and needs numpy
 try:
-    import CET_MODULE  # Replace CET_MODULE with your .pyd module name
+    from cet_common.shape_query import parse_conditions, query_sections
 except ImportError as e:
-    print(f"Error importing module: {e}")
+    print(f"Section search unavailable: {e}")
 
 # Plugin metadata
 author = "CivilEngrTools.com"
 description = "Member Property"
 category = "Steel"
 load_order = 1
+row_processor = "cet_common.member_properties:process_rows"
+
+
+def health_check():
+    """
+    Called by the host in a worker process before the plugin is loaded.
+    Raises if neither the shape database nor CET_MODULE is available.
+    """
+    open_section_service()
+
+
+def _label(symbol):
+    label = render_symbol(symbol)
+    if symbol in DERIVED_UNITS:
+        label += f" ({DERIVED_UNITS[symbol]})"
+    return label.replace("{", "{{").replace("}", "}}")
+
+
+def _pair_rows(symbols, first_cell):
+    num_pairs = len(symbols) // 2 + len(symbols) % 2
+    rows = []
+    for i in range(num_pairs):
+        j = i + num_pairs
+        left_symbol = _label(symbols[i])
+        right_symbol = _label(symbols[j] if j < len(symbols) else "")
+        left_cell, right_cell = first_cell + i, first_cell + j
+        rows.append(f"<tr><td>{left_symbol}</td><td id=\"value-{left_cell}\">{{{left_cell}}}</td>"
+                    f"<td>{right_symbol}</td><td id=\"value-{right_cell}\">{{{right_cell}}}</td></tr>")
+    return rows, 2 * num_pairs
+
+
+@lru_cache(maxsize=None)
+def property_rows_template(shape):
+    """
+    Table rows of a shape family, the section properties followed by the
+    derived design values, with a positional field for every value cell.
+    Returns the template and the number of property and design value
+    cells. The symbols are rendered only once.
+    """
+    rows, property_cells = _pair_rows(family_columns(shape), 0)
+    derived_rows, derived_cells = _pair_rows(derived_columns(shape), property_cells)
+    rows.append("<tr><th colspan=\"4\">Design Values</th></tr>")
+    return "".join(rows + derived_rows), property_cells, derived_cells
+
+
+def table_cells(shape, values, derived):
+    """
+    Formatted value cells of a table, padded to the cells of its template.
+    """
+    _, property_cells, derived_cells = property_rows_template(shape)
+    cells = [format_value(value) for value in values[:property_cells]]
+    cells += [""] * (property_cells - len(cells))
+    cells += [format_value(value) for value in derived[:derived_cells]]
+    return cells + [""] * (property_cells + derived_cells - len(cells))
+
+
+# The page around the table rows; only the rows change between families
+PAGE_HEAD = f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Member Property</title>
+    <style>
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            table-layout: fixed;
+        }}
+        th, td {{
+            border: 1px solid black;
+            text-align: center;
+            padding: 3px;
+            width: 25%;
+            word-wrap: break-word;
+        }}
+        {SYMBOL_CSS}
+    </style>
+    <script type="text/javascript">
+        // Replace all rows when the shape family (and so the symbols) changes
+        function setRows(rows) {{
+            var body = document.getElementById("property-rows");
+            body.innerHTML = rows;
+        }}
+        // Patch only the value cells that changed
+        function setValues(values) {{
+            for (var i = 0; i < values.length; i++) {{
+                var cell = document.getElementById("value-" + i);
+                if (cell && cell.textContent !== values[i]) {{
+                    cell.textContent = values[i];
+                }}
+            }}
+        }}
+    </script>
+</head>
+<body>
+<table>
+<thead><tr><th>Item</th><th>Value</th><th>Item</th><th>Value</th></tr></thead>
+<tbody id="property-rows">
+"""
+PAGE_TAIL = """
+</tbody>
+</table>
+</body>
+</html>
+"""
+
 
 class PluginUI(QWidget):
     def __init__(self):
         super().__init__()
        
-        self.shape_names = json.loads(CET_MODULE.get_shape_names())
+        # Properties come from the memory-mapped shape database when exported,
+        # otherwise from CET_MODULE, through the cache shared with other plugins
+        self.properties = open_section_service()
+        self.shape_db = self.properties.shape_db
+        self.shape_names = self.properties.shape_names()
         
         # Create dropdowns
         self.design_code_combo = QComboBox()
@@ -39,29 +157,71 @@ class PluginUI(QWidget):
         self.shape_list_combo.addItems(["W-Shapes", "Angles", "Rectangular HSS"])
         
         self.section_list_combo = QComboBox()
-        self.section_list_combo.addItems(self.shape_names["AISC 14th"]["W-Shapes"])
+
+        # Type-ahead search of the section list; the completer shows the index matches unfiltered
+        self.find_section_edit = QLineEdit()
+        self.find_section_edit.setPlaceholderText("Type to find, e.g. W14x")
+        self.find_section_model = SectionListModel()
+        self.find_section_completer = QCompleter(self.find_section_model, self)
+        self.find_section_completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.find_section_edit.setCompleter(self.find_section_completer)
+        self.show_section_list(self.design_code_combo.currentText(), self.shape_list_combo.currentText())
         
         self.grade_combo = QComboBox()
-        self.grade_combo.addItems(["A992", "A58", "A36"])
+        self.grade_combo.addItems(list(GRADES))
+        yield_stresses = ", ".join(f"{grade} {fy:g} ksi" for grade, fy in GRADES.items())
+        self.grade_combo.setToolTip(f"Minimum yield stress Fy: {yield_stresses}. A58 is taken as A588.")
         
         # Add event listeners
         self.design_code_combo.currentTextChanged.connect(self.on_design_code_changed)
         self.shape_list_combo.currentTextChanged.connect(self.on_shape_list_changed)
         self.section_list_combo.currentTextChanged.connect(self.on_section_list_changed)
+        self.grade_combo.currentTextChanged.connect(self.on_grade_changed)
+        self.find_section_edit.textEdited.connect(self.on_find_section_edited)
+        self.find_section_edit.returnPressed.connect(self.on_find_section)
+        self.find_section_completer.activated[str].connect(self.select_section)
+
+        # Section search over the shape database
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("e.g. Zx >= 150, d <= 24")
+        self.sort_combo = QComboBox()
+        self.sort_descending_check = QCheckBox("Descending")
+        self.search_button = QPushButton("Search")
+        self.search_status_label = QLabel()
+        self.search_result_list = QListWidget()
+        self.refresh_sort_columns()
+
+        self.filter_edit.returnPressed.connect(self.on_search)
+        self.search_button.clicked.connect(self.on_search)
+        self.search_result_list.currentTextChanged.connect(self.on_search_result_selected)
+
+        # Export of the whole section list with the selected grade
+        self.export_button = QPushButton("Export Table...")
+        self.export_status_label = QLabel()
+        self.export_button.clicked.connect(self.on_export)
         
-        self.web_view = QWebEngineView()
+        # The web engine starts only when the results are first shown
+        self.web_view = LazyWebView()
 
         # Variables to record activities
         self.design_code = None
         self.shape_list = None
 
+        # Lookups run off the GUI thread; bursts of changes render only the latest selection
+        self.evaluator = CoalescingEvaluator(self.evaluate, self.show_result, name="Member_Property", parent=self)
+        # Rendered rows and values of recently viewed sections
+        self.render_cache = RenderCache()
+
         # Set initial values
         design_code = self.design_code_combo.currentText()
         shape = self.shape_list_combo.currentText()
         size = self.section_list_combo.currentText()
-        sizes = CET_MODULE.get_member_section_size(design_code, shape, size)
-        html_content = self.create_property_table(sizes)
-        self.web_view.setHtml(html_content)
+        grade = self.grade_combo.currentText()
+        sizes = self.get_section_properties(design_code, shape, size)
+        derived = self.get_derived_values(design_code, shape, size, grade)
+        # The page is loaded once; later selections only patch the table
+        self.bridge = PageBridge(self.web_view, self.create_property_table(sizes, derived))
+        self.rendered_shape = shape
 
         # layout
         main_layout = QHBoxLayout(self)
@@ -82,69 +242,124 @@ class PluginUI(QWidget):
         form_layout.addRow("Design code", self.design_code_combo)
         form_layout.addRow("Shape List", self.shape_list_combo)
         form_layout.addRow("Section list", self.section_list_combo)
+        form_layout.addRow("Find section", self.find_section_edit)
         form_layout.addRow("Grade", self.grade_combo)
+        form_layout.addRow(self.export_button)
+        form_layout.addRow(self.export_status_label)
         
         vbox = QVBoxLayout()
         group_box = QGroupBox()
         group_box.setTitle("Inputs")
         group_box.setLayout(form_layout)
         vbox.addWidget(group_box)
+        vbox.addWidget(self.create_filter_panel())
 
         return vbox
-    def create_property_table(self, values):
+
+    def create_filter_panel(self):
+        form_layout = QFormLayout()
+        form_layout.setLabelAlignment(Qt.AlignLeft)
+        form_layout.setVerticalSpacing(8)
+
+        sort_layout = QHBoxLayout()
+        sort_layout.addWidget(self.sort_combo)
+        sort_layout.addWidget(self.sort_descending_check)
+
+        form_layout.addRow("Conditions", self.filter_edit)
+        form_layout.addRow("Sort by", sort_layout)
+        form_layout.addRow(self.search_button)
+        form_layout.addRow(self.search_status_label)
+        form_layout.addRow(self.search_result_list)
+
+        group_box = QGroupBox("Section Search")
+        group_box.setLayout(form_layout)
+        if self.shape_db is None:
+            group_box.setEnabled(False)
+            group_box.setToolTip("Export the shape database (python -m cet_common.shape_db) to enable search.")
+        return group_box
+
+    def refresh_sort_columns(self):
         shape = self.shape_list_combo.currentText()
-        
-        symbols_dict = {
-            "W-Shapes": ["A", "d", "d_{det}", "t_w", "t_{w,det}", "b_f", "b_{f,det}", "t_f", "t_{f,det}", "k_{des}", "k_{det}", "k_1", "T", "g", "W_t", "I_x", "S_x", "r_x", "Z_x", "I_y", "S_y", "r_y", "Z_y", "J", "C_w"],
-            "Angles": ["k", "W_t", "A", "I_x", "S_x", "r_x", "\overline{y}", "Z_x", "y_p", "J", "Cw", "r_o", "I_y", "S_y", "r_y", "\overline{x}", "Z_y", "x_p", "I_z", "S_z", "r_z", "T_{\\alpha}", "Qs", "d", "B", "t"],
-            "Default": ["t_{des}", "t_{nom}", "W", "A", "I_x", "S_x", "r_x", "Z_x", "I_y", "S_y", "r_y", "Z_y", "J", "C", "H_t", "B"]
-        }
-        
-        symbols = symbols_dict.get(shape, symbols_dict["Default"])
-        
-        rows = ""
-        num_pairs = len(symbols) // 2 + len(symbols) % 2
-        for i in range(num_pairs):
-            left_symbol = symbols[i]
-            right_symbol = symbols[i + num_pairs] if i + num_pairs < len(symbols) else ""
-            left_value = values[i] if i < len(values) else ""
-            right_value = values[i + num_pairs] if i + num_pairs < len(values) else ""
-            rows += f"<tr><td>\\({left_symbol}\\)</td><td>{left_value}</td><td>\\({right_symbol}\\)</td><td>{right_value}</td></tr>"
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <title>Member Property</title>
-            <style>
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    table-layout: fixed;
-                }}
-                th, td {{
-                    border: 1px solid black;
-                    text-align: center;
-                    padding: 3px;
-                    width: 25%;
-                    word-wrap: break-word;
-                }}
-            </style>
-            <script type="text/javascript" id="MathJax-script" async
-                src="https://cdn.jsdelivr.net/npm/mathjax@3.1.2/es5/tex-svg.js">
-            </script>
-        </head>
-        <body>
-        <table>
-        <tr><th>Item</th><th>Value</th><th>Item</th><th>Value</th></tr>
-        {rows}
-        </table>
-        </body>
-        </html>
+        self.sort_combo.clear()
+        self.sort_combo.addItem("")
+        if self.shape_db is not None:
+            self.sort_combo.addItems([plain_symbol(symbol) for symbol in family_columns(shape)])
+
+    def on_search(self):
+        design_code = self.design_code_combo.currentText()
+        shape = self.shape_list_combo.currentText()
+        order_by = self.sort_combo.currentText() or None
+        self.search_result_list.clear()
+        try:
+            start = time.perf_counter()
+            conditions = parse_conditions(self.filter_edit.text())
+            result = query_sections(self.shape_db, design_code, shape, conditions, order_by=order_by,
+                                    descending=self.sort_descending_check.isChecked())
+            elapsed = (time.perf_counter() - start) * 1000
+        except ValueError as e:
+            self.search_status_label.setText(str(e))
+            return
+        self.search_result_list.addItems(result.names.tolist())
+        self.search_status_label.setText(f"{len(result.names)} sections found in {elapsed:.1f} ms")
+
+    def on_search_result_selected(self, value):
+        if value:
+            self.select_section(value)
+
+    def export_table(self, path, design_code=None, shape=None, grade=None):
         """
-        
-        return html_content
+        Write the properties and derived values of every section of the
+        edition and family to a CSV or .npy file, row by row.
+        """
+        design_code = design_code or self.design_code_combo.currentText()
+        shape = shape or self.shape_list_combo.currentText()
+        grade = grade or self.grade_combo.currentText()
+        rows = self.properties.iter_family(design_code, shape, grade)
+        count = len(self.properties.section_names(design_code, shape))
+        return export_rows(path, rows, export_fields(shape), count, TEXT_FIELDS)
+
+    def on_export(self):
+        design_code = self.design_code_combo.currentText()
+        shape = self.shape_list_combo.currentText()
+        export_with_dialog(self, "Export Table", f"{design_code} {shape}.csv",
+                           lambda path: self.export_table(path, design_code, shape), "sections",
+                           self.export_status_label)
+
+    def show_section_list(self, design_code, shape):
+        # The models are shared and built once per edition and family, so switching lists is O(1)
+        model, self.section_index = section_list_model(self.shape_names, design_code, shape)
+        self.section_list_combo.setModel(model)
+        self.find_section_edit.clear()
+
+    def select_section(self, name):
+        row = self.section_index.row(name)
+        if row >= 0:
+            self.section_list_combo.setCurrentIndex(row)
+
+    def on_find_section_edited(self, text):
+        self.find_section_model.set_names(self.section_index.search(text))
+
+    def on_find_section(self):
+        matches = self.section_index.search(self.find_section_edit.text(), limit=1)
+        if matches:
+            self.select_section(matches[0])
+
+    def get_section_properties(self, design_code, shape, size):
+        return self.properties.get(design_code, shape, size)
+
+    def get_derived_values(self, design_code, shape, size, grade):
+        # Left empty when numpy (and so the derived values) is unavailable
+        if self.properties.derived is None:
+            return ()
+        return self.properties.derived.get(design_code, shape, size, grade)
+
+    def create_property_rows(self, shape, values, derived):
+        template = property_rows_template(shape)[0]
+        return template.format(*table_cells(shape, values, derived))
+
+    def create_property_table(self, values, derived):
+        shape = self.shape_list_combo.currentText()
+        return "".join((PAGE_HEAD, self.create_property_rows(shape, values, derived), PAGE_TAIL))
 
     def create_right_panel(self):
         group_box = QGroupBox("Results")
@@ -161,28 +376,64 @@ class PluginUI(QWidget):
     
     def on_design_code_changed(self, value):
         self.design_code = value  
-        self.section_list_combo.clear()
-        shape = self.shape_list_combo.currentText()
-        use_code = "AISC 14th" if value == "AISC 13th" else value
-        self.section_list_combo.addItems(self.shape_names[use_code][shape])  
+        self.show_section_list(value, self.shape_list_combo.currentText())
+        self.search_result_list.clear()
         self.update()
 
     def on_shape_list_changed(self, value):
         self.shape_list = value 
-        self.section_list_combo.clear()
-        design_code = self.design_code_combo.currentText()
-        use_code = "AISC 14th" if design_code == "AISC 13th" else design_code
-        self.section_list_combo.addItems(self.shape_names[use_code][value])  
+        self.show_section_list(self.design_code_combo.currentText(), value)
+        self.refresh_sort_columns()
+        self.search_result_list.clear()
         self.update()
     
     def on_section_list_changed(self):
         self.update()
 
+    def on_grade_changed(self):
+        self.update()
+
+    def save_state(self):
+        return {
+            "design_code": self.design_code_combo.currentText(),
+            "shape": self.shape_list_combo.currentText(),
+            "section": self.section_list_combo.currentText(),
+            "grade": self.grade_combo.currentText(),
+        }
+
+    def restore_state(self, state):
+        # Order matters: each combo refills the section list
+        self.design_code_combo.setCurrentText(state["design_code"])
+        self.shape_list_combo.setCurrentText(state["shape"])
+        self.section_list_combo.setCurrentText(state["section"])
+        self.grade_combo.setCurrentText(state["grade"])
+
+    def teardown(self):
+        self.evaluator.cancel()
+        self.web_view.release()
+
     def update(self):
         design_code = self.design_code_combo.currentText()
         shape = self.shape_list_combo.currentText()
         size = self.section_list_combo.currentText()
+        grade = self.grade_combo.currentText()
         if not size == "":
-            sizes = CET_MODULE.get_member_section_size(design_code, shape, size)
-            html_content = self.create_property_table(sizes)
-            self.web_view.setHtml(html_content)
+            self.evaluator.request(design_code, shape, size, grade)
+
+    def evaluate(self, design_code, shape, size, grade):
+        # Runs on a worker thread
+        return self.render_cache.get((design_code, shape, size, grade), self.render_section)
+
+    def render_section(self, design_code, shape, size, grade):
+        values = self.get_section_properties(design_code, shape, size)
+        derived = self.get_derived_values(design_code, shape, size, grade)
+        cells = table_cells(shape, values, derived)
+        return shape, property_rows_template(shape)[0].format(*cells), cells
+
+    def show_result(self, result):
+        shape, rows, cells = result
+        if shape != self.rendered_shape:
+            self.bridge.call("setRows", rows)
+            self.rendered_shape = shape
+        else:
+            self.bridge.call("setValues", cells)
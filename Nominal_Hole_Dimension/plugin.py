@@ -1,84 +1,119 @@
-from PySide2.QtWidgets import QHBoxLayout, QVBoxLayout, QFormLayout, QComboBox, QWidget, QGroupBox
+from PySide2.QtWidgets import (QHBoxLayout, QVBoxLayout, QFormLayout, QComboBox, QWidget, QGroupBox, QPushButton,
+                               QLabel)
 from PySide2.QtCore import Qt
-from PySide2.QtWebEngineWidgets import QWebEngineView
-import json, re
-from fractions import Fraction
-
 import sys, os
-module_path = os.getenv('APPDATA') + "/CET_SteelConnDesign"
-
-if not os.path.exists(module_path):
-    module_path = "../"
 
-# Add to sys.path
-if module_path not in sys.path:
-    sys.path.insert(0, module_path)
+# Add the plugins folder so the shared cet_common helpers can be imported
+plugins_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if plugins_path not in sys.path:
+    sys.path.append(plugins_path)
 
-# Import your module
-try:
-    import CET_MODULE  # Replace CET_MODULE with your .pyd module name
-except ImportError as e:
-    print(f"Error importing module: {e}")
+from cet_common.aisc import EDITIONS, HOLE_TYPES, IMPERIAL_DIAMETERS, METRIC_DIAMETERS, SLOT_TYPES, UNITS
+from cet_common.export import export_rows, export_with_dialog
+from cet_common.hole_dimensions import EXPORT_FIELDS, TEXT_FIELDS, hole_count, open_hole_service
+from cet_common.qt_worker import CoalescingEvaluator
+from cet_common.render_cache import RenderCache
+from cet_common.units import SYSTEM_UNITS, convert_length
+from cet_common.web_bridge import LazyWebView, PageBridge
 
 # Plugin metadata
 author = "CivilEngrTools.com"
 description = "Nomial Hole Dimension"
 category = "Steel"
 load_order = 2
+row_processor = "cet_common.hole_dimensions:process_rows"
 
-def extract_and_format_dimensions(dim_string):
-    # Use regular expression to find all numbers in the string
-    numbers = re.findall(r"\d+\.?\d*", dim_string)
-    
-    # Convert numbers to floats and format to two decimal places
-    if len(numbers) == 2:
-        formatted_numbers = [f"{float(num):.4f}" for num in numbers]
-        return float(formatted_numbers[0]), float(formatted_numbers[1])
-    else:
-        raise ValueError("The input string does not contain exactly two numbers.")
-
-def fraction_to_decimal(fraction_str):
-    # Remove units like "in." or "mm" by splitting and keeping only the numeric part
-    numeric_part = fraction_str.split(" in.")[0].split(" mm")[0]
-    
-    if " " in numeric_part:  # Handle mixed fractions like "1 1/8"
-        whole, frac = numeric_part.split()
-        decimal_value = int(whole) + float(Fraction(frac))
-    elif "/" in numeric_part:  # Handle simple fractions like "1/2"
-        decimal_value = float(Fraction(numeric_part))
-    else:  # Handle whole numbers like "36"
-        decimal_value = float(numeric_part)
-    
-    return decimal_value
+
+def health_check():
+    """
+    Called by the host in a worker process before the plugin is loaded.
+    Raises if neither the hole table nor CET_MODULE is available.
+    """
+    open_hole_service()
+
+
+# Element id, tag, geometry attributes and fixed styling of the slot drawing, in drawing order
+SLOT_SVG_ELEMENTS = [
+    ("slot-hole", "rect", ("x", "y", "width", "height", "rx", "ry"), 'fill="lightgray" stroke="black" stroke-width="1"'),
+    ("length-line", "line", ("x1", "y1", "x2", "y2"), 'stroke="black" stroke-width="1"'),
+    ("length-arrow-start", "polygon", ("points",), 'fill="black"'),
+    ("length-arrow-end", "polygon", ("points",), 'fill="black"'),
+    ("length-text", "text", ("x", "y"), 'font-size="14" text-anchor="middle" fill="black"'),
+    ("width-line", "line", ("x1", "y1", "x2", "y2"), 'stroke="black" stroke-width="1"'),
+    ("width-arrow-start", "polygon", ("points",), 'fill="black"'),
+    ("width-arrow-end", "polygon", ("points",), 'fill="black"'),
+    ("width-text", "text", ("x", "y"), 'font-size="14" text-anchor="end" fill="black" dominant-baseline="middle"'),
+]
+
+
+def compile_slot_svg_template():
+    """
+    Return the slot drawing as a format string with a positional field for
+    every geometry value, and the (element id, attribute) of each field.
+    """
+    fields = [("slot-svg", "width"), ("slot-svg", "height"), ("slot-svg", "viewBox")]
+    parts = ['<svg id="slot-svg" xmlns="http://www.w3.org/2000/svg" width="{0}" height="{1}" viewBox="{2}">']
+    for element_id, tag, attributes, style in SLOT_SVG_ELEMENTS:
+        attribute_text = []
+        for name in attributes:
+            attribute_text.append(f'{name}="{{{len(fields)}}}"')
+            fields.append((element_id, name))
+        # The labels are the text content of their element
+        text = ""
+        if tag == "text":
+            text = f"{{{len(fields)}}}"
+            fields.append((element_id, "text"))
+        parts.append(f'<{tag} id="{element_id}" {" ".join(attribute_text)} {style}>{text}</{tag}>')
+    parts.append("</svg>")
+    return "\n".join(parts), fields
+
+
+SLOT_SVG_TEMPLATE, SLOT_SVG_FIELDS = compile_slot_svg_template()
 
 
 class PluginUI(QWidget):
     def __init__(self):
         super().__init__()
+
+        # Precomputed table shipped with the plugin; CET_MODULE is only needed without it
+        self.holes = open_hole_service()
         
         # Create dropdowns
         self.design_code_combo = QComboBox()
-        self.design_code_combo.addItems(["AISC 13th", "AISC 14th", "AISC 15th"])
+        self.design_code_combo.addItems(EDITIONS)
         self.design_code_combo.setCurrentText("AISC 14th")
         
         self.unit_list_combo = QComboBox()
-        self.unit_list_combo.addItems(["Imperial Units", "Metric Units"])
+        self.unit_list_combo.addItems(UNITS)
         
         self.diameter_list_combo = QComboBox()
-        self.imperial_dia_list = ["1/2 in.", "5/8 in.", "3/4 in.", "7/8 in.", "1 in.", "1 1/8 in.", "1 1/4 in.", "1 1/2 in."]
-        self.metric_dia_list = ["16 mm", "20 mm", "22 mm", "24 mm", "27 mm", "30 mm", "33 mm", "36 mm"]
+        self.imperial_dia_list = list(IMPERIAL_DIAMETERS)
+        self.metric_dia_list = list(METRIC_DIAMETERS)
         self.diameter_list_combo.addItems(self.imperial_dia_list)
         
         self.hole_type_combo = QComboBox()
-        self.hole_type_combo.addItems(["Standard", "Oversize", "Short Slot", "Long Slot"])
+        self.hole_type_combo.addItems(HOLE_TYPES)
         
         # Add event listeners
         self.design_code_combo.currentTextChanged.connect(self.on_design_code_changed)
         self.unit_list_combo.currentTextChanged.connect(self.on_unit_list_changed)
         self.diameter_list_combo.currentTextChanged.connect(self.on_diameter_list_changed)
         self.hole_type_combo.currentTextChanged.connect(self.on_hole_type_changed)
+
+        # Export of every edition, unit system, diameter and hole type
+        self.export_button = QPushButton("Export All Holes...")
+        self.export_status_label = QLabel()
+        self.export_button.clicked.connect(self.on_export)
         
-        self.web_view = QWebEngineView()
+        # The web engine starts only when the results are first shown
+        self.web_view = LazyWebView()
+        # The page is loaded once; later selections only patch text and SVG attributes
+        self.bridge = PageBridge(self.web_view, self.create_hole_page())
+
+        # Lookups run off the GUI thread; bursts of changes render only the latest selection
+        self.evaluator = CoalescingEvaluator(self.evaluate, self.show_result, name="Nominal_Hole_Dimension", parent=self)
+        # Hole and drawing geometry of recent selections, per viewport size
+        self.render_cache = RenderCache()
 
         # Set initial values
         self.update()
@@ -103,6 +138,8 @@ class PluginUI(QWidget):
         form_layout.addRow("Measurement Unit", self.unit_list_combo)
         form_layout.addRow("Bolt Diameter", self.diameter_list_combo)
         form_layout.addRow("Hole Type", self.hole_type_combo)
+        form_layout.addRow(self.export_button)
+        form_layout.addRow(self.export_status_label)
         
         vbox = QVBoxLayout()
         group_box = QGroupBox()
@@ -124,49 +161,95 @@ class PluginUI(QWidget):
         
         return vbox
     
-    def generate_slot_hole_svg(self, slot_width, slot_length, x, y, width, height):
+    def slot_hole_geometry(self, slot_width, slot_length, x, y, width, height, unit=None):
         """
-        Generate an SVG string with a slot hole, dimension lines, and arrows for the selected unit system.
+        Compute the attributes of every element of the slot drawing, keyed by element id.
         """
         arrow_size = 5  # Size of the arrowhead
+        if unit is None:
+            unit = self.unit_list_combo.currentText()
 
-        # Convert dimensions to imperial if needed
-        if self.unit_list_combo.currentText() == "Imperial Units":
-            width_label = slot_width / 25.4
-            length_label = slot_length / 25.4
-            unit_label = "in"
-        else:
-            width_label = slot_width
-            length_label = slot_length
-            unit_label = "mm"
+        # The drawing is in millimeters; label it in the selected unit system
+        unit_label = SYSTEM_UNITS[unit]
+        width_label = convert_length(slot_width, "mm", unit_label)
+        length_label = convert_length(slot_length, "mm", unit_label)
+
+        return {
+            "slot-svg": {"width": width, "height": height, "viewBox": f"0 0 {width} {height}"},
+            "slot-hole": {"x": x, "y": y, "width": slot_length, "height": slot_width,
+                          "rx": slot_width / 2, "ry": slot_width / 2},
+            # Dimension line and arrows for length
+            "length-line": {"x1": x, "y1": y - 20, "x2": x + slot_length, "y2": y - 20},
+            "length-arrow-start": {"points": f"{x},{y - 20} {x + arrow_size},{y - 25} {x + arrow_size},{y - 15}"},
+            "length-arrow-end": {"points": f"{x + slot_length},{y - 20} {x + slot_length - arrow_size},{y - 25} "
+                                           f"{x + slot_length - arrow_size},{y - 15}"},
+            "length-text": {"x": x + slot_length / 2, "y": y - 30, "text": f"{length_label} {unit_label}"},
+            # Dimension line and arrows for width
+            "width-line": {"x1": x - 20, "y1": y, "x2": x - 20, "y2": y + slot_width},
+            "width-arrow-start": {"points": f"{x - 20},{y} {x - 25},{y + arrow_size} {x - 15},{y + arrow_size}"},
+            "width-arrow-end": {"points": f"{x - 20},{y + slot_width} {x - 25},{y + slot_width - arrow_size} "
+                                          f"{x - 15},{y + slot_width - arrow_size}"},
+            "width-text": {"x": x - 30, "y": y + slot_width / 2, "text": f"{width_label} {unit_label}"},
+        }
+
+    def generate_slot_hole_svg(self, slot_width, slot_length, x, y, width, height, unit=None):
+        """
+        Generate an SVG string with a slot hole, dimension lines, and arrows for the selected unit system.
+        """
+        geometry = self.slot_hole_geometry(slot_width, slot_length, x, y, width, height, unit)
+        return SLOT_SVG_TEMPLATE.format(*[geometry[element_id][name] for element_id, name in SLOT_SVG_FIELDS])
 
+    def create_hole_page(self):
+        # The drawing stays hidden until a slotted hole is selected
+        svg_content = self.generate_slot_hole_svg(0, 0, x=100, y=50, width=300, height=400)
         return f"""
-        <svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
-            <!-- Slot Hole -->
-            <rect x="{x}" y="{y}" width="{slot_length}" height="{slot_width}" rx="{slot_width / 2}" 
-                  ry="{slot_width / 2}" fill="lightgray" stroke="black" stroke-width="1" />
-
-            <!-- Dimension Line for Length -->
-            <line x1="{x}" y1="{y - 20}" x2="{x + slot_length}" y2="{y - 20}" stroke="black" stroke-width="1" />
-            <!-- Left Arrow for Length -->
-            <polygon points="{x},{y - 20} {x + arrow_size},{y - 25} {x + arrow_size},{y - 15}" fill="black" />
-            <!-- Right Arrow for Length -->
-            <polygon points="{x + slot_length},{y - 20} {x + slot_length - arrow_size},{y - 25} {x + slot_length - arrow_size},{y - 15}" fill="black" />
-            <!-- Text for Length -->
-            <text x="{x + slot_length / 2}" y="{y - 30}" font-size="14" text-anchor="middle" fill="black">{length_label} {unit_label}</text>
-
-            <!-- Dimension Line for Width -->
-            <line x1="{x - 20}" y1="{y}" x2="{x - 20}" y2="{y + slot_width}" stroke="black" stroke-width="1" />
-            <!-- Top Arrow for Width -->
-            <polygon points="{x - 20},{y} {x - 25},{y + arrow_size} {x - 15},{y + arrow_size}" fill="black" />
-            <!-- Bottom Arrow for Width -->
-            <polygon points="{x - 20},{y + slot_width} {x - 25},{y + slot_width - arrow_size} {x - 15},{y + slot_width - arrow_size}" fill="black" />
-            <!-- Text for Width -->
-            <text x="{x - 30}" y="{y + slot_width / 2}" font-size="14" text-anchor="end" fill="black"
-                  dominant-baseline="middle">{width_label} {unit_label}</text>
-        </svg>
+        <html>
+        <head>
+        <script type="text/javascript">
+            function setHole(dimension, reference, geometry) {{
+                document.getElementById("hole-dimension").innerHTML = dimension;
+                document.getElementById("hole-reference").innerHTML = reference;
+                var drawing = document.getElementById("slot-drawing");
+                if (!geometry) {{
+                    drawing.style.display = "none";
+                    return;
+                }}
+                for (var id in geometry) {{
+                    var element = document.getElementById(id);
+                    var attributes = geometry[id];
+                    for (var name in attributes) {{
+                        if (name === "text") {{
+                            element.textContent = attributes[name];
+                        }} else {{
+                            element.setAttribute(name, attributes[name]);
+                        }}
+                    }}
+                }}
+                drawing.style.display = "";
+            }}
+        </script>
+        </head>
+        <body>
+            Hole Dimension: <span id="hole-dimension"></span><br>
+            <span id="hole-reference"></span>
+            <span id="slot-drawing" style="display: none">{svg_content}</span>
+        </body>
+        </html>
         """
     
+    def get_hole_dimension(self, design_code, unit, diameter, hole_type):
+        return self.holes.get(design_code, unit, diameter, hole_type)
+
+    def export_table(self, path):
+        """
+        Write the dimensions of every hole to a CSV or .npy file, row by row.
+        """
+        return export_rows(path, self.holes.iter_all(), EXPORT_FIELDS, hole_count(), TEXT_FIELDS)
+
+    def on_export(self):
+        export_with_dialog(self, "Export All Holes", "Nominal Hole Dimensions.csv", self.export_table, "holes",
+                           self.export_status_label)
+
     def on_design_code_changed(self, value):
         self.update()
 
@@ -181,6 +264,25 @@ class PluginUI(QWidget):
     def on_hole_type_changed(self):
         self.update()
 
+    def save_state(self):
+        return {
+            "design_code": self.design_code_combo.currentText(),
+            "unit": self.unit_list_combo.currentText(),
+            "diameter": self.diameter_list_combo.currentText(),
+            "hole_type": self.hole_type_combo.currentText(),
+        }
+
+    def restore_state(self, state):
+        # The unit refills the diameter list, so it goes first
+        self.design_code_combo.setCurrentText(state["design_code"])
+        self.unit_list_combo.setCurrentText(state["unit"])
+        self.diameter_list_combo.setCurrentText(state["diameter"])
+        self.hole_type_combo.setCurrentText(state["hole_type"])
+
+    def teardown(self):
+        self.evaluator.cancel()
+        self.web_view.release()
+
     def update(self):
         design_code = self.design_code_combo.currentText()
         unit = self.unit_list_combo.currentText()
@@ -188,33 +290,24 @@ class PluginUI(QWidget):
         dia_str = self.diameter_list_combo.currentText()
 
         if not dia_str == "":
-            diameter = fraction_to_decimal(dia_str)
-            results = json.loads(CET_MODULE.get_hole_info(design_code, unit, diameter, hole_type))
+            width = max(self.web_view.width() - 50, 300)
+            height = max(self.web_view.height() - 100, 400)
+            self.evaluator.request(design_code, unit, dia_str, hole_type, width, height)
 
-            if hole_type == "Short Slot" or hole_type == "Long Slot":
-                dimension = extract_and_format_dimensions(results["Hole diameter"]["content"])
-                slot_width = dimension[0]
-                slot_length = dimension[1]
+    def evaluate(self, design_code, unit, dia_str, hole_type, width, height):
+        # Runs on a worker thread, so widget state is passed in
+        return self.render_cache.get((design_code, unit, dia_str, hole_type, width, height), self.render_hole)
 
-                if unit == "Imperial Units":
-                    slot_width *= 25.4
-                    slot_length *= 25.4
-        
-                w = self.web_view.width()
-                width = max(self.web_view.width() - 50, 300)
-                height = max(self.web_view.height() - 100, 400)
-
-                svg_content = self.generate_slot_hole_svg(slot_width, slot_length, x=100, y=50, width=width, height=height)
-            else:
-                svg_content = ""
-            html_content = f"""
-            <html>
-            <body>
-                Hole Dimension: {results["Hole diameter"]["content"]}<br>
-                {results["Hole diameter reference"]["content"]}
-                {svg_content}
-            </body>
-            </html>
-            """
-            self.web_view.setHtml(html_content)
+    def render_hole(self, design_code, unit, dia_str, hole_type, width, height):
+        hole = self.get_hole_dimension(design_code, unit, dia_str, hole_type)
+        if hole_type in SLOT_TYPES:
+            slot_width = convert_length(hole.slot_width, SYSTEM_UNITS[unit], "mm")
+            slot_length = convert_length(hole.slot_length, SYSTEM_UNITS[unit], "mm")
+            geometry = self.slot_hole_geometry(slot_width, slot_length, x=100, y=50, width=width, height=height, unit=unit)
+        else:
+            geometry = None
+        return hole, geometry
 
+    def show_result(self, result):
+        hole, geometry = result
+        self.bridge.call("setHole", hole.content, hole.reference, geometry)
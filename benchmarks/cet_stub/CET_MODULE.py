@@ -0,0 +1,312 @@
+"""
+Pure-Python stand-in for CET_MODULE (CET_MODULE.cp38-win_amd64.pyd) used by
+the benchmarks on machines without the compiled module.
+
+It implements get_shape_names, get_member_section_size and get_hole_info
+with the same signatures and return types. Section properties are computed
+from an idealized geometry of each section, so they are plausible but not
+the published AISC values; hole dimensions follow AISC Tables J3.3 and J3.3M.
+
+Every call sleeps for a fixed latency to stand in for the native call. Set
+CET_STUB_LATENCY to scale them (0 disables the delays).
+"""
+import json
+import math
+import os
+import time
+from fractions import Fraction
+
+LATENCY_SCALE = float(os.getenv("CET_STUB_LATENCY", "1"))
+
+# Seconds per call
+SHAPE_NAMES_LATENCY = 0.02
+SECTION_SIZE_LATENCY = 0.0005
+HOLE_INFO_LATENCY = 0.0003
+
+# Nominal depth and weights (lb/ft) of the W-shapes
+W_SERIES = {
+    44: (335, 290, 262, 230),
+    40: (655, 593, 503, 431, 397, 372, 362, 324, 297, 277, 249, 215, 199, 183, 167, 149),
+    36: (925, 853, 802, 723, 652, 529, 487, 441, 395, 361, 330, 302, 282, 262, 247, 231,
+         256, 232, 210, 194, 182, 170, 160, 150, 135),
+    33: (387, 354, 318, 291, 263, 241, 221, 201, 169, 152, 141, 130, 118),
+    30: (391, 357, 326, 292, 261, 235, 211, 191, 173, 148, 132, 124, 116, 108, 99, 90),
+    27: (539, 368, 336, 307, 281, 258, 235, 217, 194, 178, 161, 146, 129, 114, 102, 94, 84),
+    24: (370, 335, 306, 279, 250, 229, 207, 192, 176, 162, 146, 131, 117, 104, 103, 94, 84, 76, 68, 62, 55),
+    21: (201, 182, 166, 147, 132, 122, 111, 101, 93, 83, 73, 68, 62, 55, 57, 50, 48, 44),
+    18: (311, 283, 258, 234, 211, 192, 175, 158, 143, 130, 119, 106, 97, 86, 76, 71, 65, 60, 55, 50, 46, 40, 35),
+    16: (100, 89, 77, 67, 57, 50, 45, 40, 36, 31, 26),
+    14: (730, 665, 605, 550, 500, 455, 426, 398, 370, 342, 311, 283, 257, 233, 211, 193, 176, 159, 145,
+         132, 120, 109, 99, 90, 82, 74, 68, 61, 53, 48, 43, 38, 34, 30, 26, 22),
+    12: (336, 305, 279, 252, 230, 210, 190, 170, 152, 136, 120, 106, 96, 87, 79, 72, 65, 58, 53, 50,
+         45, 40, 35, 30, 26, 22, 19, 16, 14),
+    10: (112, 100, 88, 77, 68, 60, 54, 49, 45, 39, 33, 30, 26, 22, 19, 17, 15, 12),
+    8: (67, 58, 48, 40, 35, 31, 28, 24, 21, 18, 15, 13, 10),
+    6: (25, 20, 15, 16, 12, 9, 8.5),
+    5: (19, 16),
+    4: (13,),
+}
+# Sections added in the 15th edition
+W_SERIES_15TH = {
+    40: (392, 331, 327, 294, 278, 264, 235, 211),
+}
+
+# Leg lengths (in.) and thickness range (in.) of the angles
+ANGLE_SERIES = (
+    (8, 8, "1/2", "1 1/8"), (8, 6, "7/16", "1"), (8, 4, "7/16", "1"), (7, 4, "3/8", "3/4"),
+    (6, 6, "5/16", "1"), (6, 4, "5/16", "7/8"), (6, "3 1/2", "5/16", "1/2"), (5, 5, "5/16", "7/8"),
+    (5, "3 1/2", "1/4", "3/4"), (5, 3, "1/4", "1/2"), (4, 4, "1/4", "3/4"), (4, "3 1/2", "1/4", "1/2"),
+    (4, 3, "1/4", "5/8"), ("3 1/2", "3 1/2", "1/4", "1/2"), (3, 3, "3/16", "1/2"), (3, 2, "3/16", "1/2"),
+    ("2 1/2", "2 1/2", "3/16", "1/2"), (2, 2, "1/8", "3/8"),
+)
+
+# Outside dimensions (in.) of the rectangular HSS
+HSS_SIZES = (
+    (20, 12), (20, 8), (20, 4), (18, 6), (16, 12), (16, 8), (16, 4), (14, 10), (14, 6), (14, 4),
+    (12, 10), (12, 8), (12, 6), (12, 4), (12, 3), (12, 2), (10, 8), (10, 6), (10, 5), (10, 4),
+    (10, 3), (10, 2), (9, 7), (9, 5), (9, 3), (8, 6), (8, 4), (8, 3), (8, 2), (7, 5), (7, 4),
+    (7, 3), (7, 2), (6, 5), (6, 4), (6, 3), (6, 2), (5, 4), (5, 3), (5, 2), (4, 3), (4, 2), (3, 2), (3, 1),
+)
+HSS_THICKNESSES = ("1/8", "3/16", "1/4", "5/16", "3/8", "1/2", "5/8")
+
+E = 29000.0  # ksi
+STEEL_WEIGHT = 3.4  # lb/ft per in.^2 of area
+
+
+def _fraction_label(value):
+    whole, rest = divmod(Fraction(value), 1)
+    if rest == 0:
+        return str(whole)
+    return f"{whole}-{rest}" if whole else str(rest)
+
+
+def _inches(label):
+    return sum(Fraction(part) for part in str(label).split())
+
+
+def _w_shape(depth, weight):
+    """
+    Properties of an idealized W-shape (no fillets) with flanges 1.6 times
+    as thick as the web.
+    """
+    area = weight / STEEL_WEIGHT
+    d = depth + 0.012 * max(0.0, weight - 2 * depth ** 1.5)
+    bf = min(d, max(0.3 * d + 1, 2.2 * math.sqrt(area)), 18.0)
+    b = 3.2 * bf + d
+    tw = (b - math.sqrt(b * b - 12.8 * area)) / 6.4
+    tf = 1.6 * tw
+    h = d - 2 * tf
+
+    ix = (bf * d ** 3 - (bf - tw) * h ** 3) / 12
+    iy = (2 * tf * bf ** 3 + h * tw ** 3) / 12
+    zx = bf * tf * (d - tf) + tw * h * h / 4
+    zy = tf * bf * bf / 2 + h * tw * tw / 4
+    k_des = tf + 0.5 * tw + 0.25
+    k_det = math.ceil(k_des * 16) / 16
+    return [area, d, round(d * 8) / 8, tw, math.ceil(tw * 16) / 16, bf, round(bf * 8) / 8, tf,
+            round(tf * 16) / 16, k_des, k_det, tw / 2 + 0.5, d - 2 * k_det, 5.5 if bf > 8 else 3.5,
+            weight, ix, ix / (d / 2), math.sqrt(ix / area), zx, iy, iy / (bf / 2), math.sqrt(iy / area),
+            zy, (2 * bf * tf ** 3 + (d - tf) * tw ** 3) / 3, iy * (d - tf) ** 2 / 4]
+
+
+def _plastic_modulus(rectangles, axis):
+    """
+    Plastic section modulus of a set of non-overlapping rectangles
+    (x0, x1, y0, y1) about the equal-area axis parallel to x (axis 0) or y (axis 1).
+    """
+    spans = [(y0, y1, x1 - x0) if axis == 0 else (x0, x1, y1 - y0) for x0, x1, y0, y1 in rectangles]
+    half = sum((s1 - s0) * width for s0, s1, width in spans) / 2
+
+    def area_below(axis_position):
+        return sum(width * min(max(axis_position - s0, 0), s1 - s0) for s0, s1, width in spans)
+
+    # Bisect for the axis that splits the area in half
+    lo, hi = min(span[0] for span in spans), max(span[1] for span in spans)
+    for _ in range(60):
+        neutral = (lo + hi) / 2
+        if area_below(neutral) < half:
+            lo = neutral
+        else:
+            hi = neutral
+    modulus = 0.0
+    for s0, s1, width in spans:
+        for lo, hi in ((s0, min(s1, neutral)), (max(s0, neutral), s1)):
+            if hi > lo:
+                modulus += width * (hi - lo) * abs((lo + hi) / 2 - neutral)
+    return modulus, neutral
+
+
+def _angle(d, b, t):
+    """
+    Properties of an angle with a vertical leg d and a horizontal leg b,
+    both of thickness t, without fillets or toe rounding.
+    """
+    rectangles = [(0, t, t, d), (0, b, 0, t)]
+    area = sum((x1 - x0) * (y1 - y0) for x0, x1, y0, y1 in rectangles)
+    x_bar = sum((x1 - x0) * (y1 - y0) * (x0 + x1) / 2 for x0, x1, y0, y1 in rectangles) / area
+    y_bar = sum((x1 - x0) * (y1 - y0) * (y0 + y1) / 2 for x0, x1, y0, y1 in rectangles) / area
+    ix = iy = ixy = 0.0
+    for x0, x1, y0, y1 in rectangles:
+        w, h = x1 - x0, y1 - y0
+        cx, cy = (x0 + x1) / 2 - x_bar, (y0 + y1) / 2 - y_bar
+        ix += w * h ** 3 / 12 + w * h * cy * cy
+        iy += h * w ** 3 / 12 + w * h * cx * cx
+        ixy += w * h * cx * cy
+    iz = (ix + iy) / 2 - math.sqrt(((ix - iy) / 2) ** 2 + ixy ** 2)
+    tan_alpha = abs(math.tan(0.5 * math.atan2(-2 * ixy, ix - iy)))
+    zx, y_p = _plastic_modulus(rectangles, 0)
+    zy, x_p = _plastic_modulus(rectangles, 1)
+    x_0, y_0 = x_bar - t / 2, y_bar - t / 2
+    d_mid, b_mid = d - t / 2, b - t / 2
+    slenderness = max(d, b) / t * math.sqrt(36 / E)
+    if slenderness <= 0.45:
+        qs = 1.0
+    elif slenderness <= 0.91:
+        qs = 1.34 - 0.76 * slenderness
+    else:
+        qs = 0.53 / slenderness ** 2
+    return [t + 0.375, area * STEEL_WEIGHT, area, ix, ix / (d - y_bar), math.sqrt(ix / area), y_bar, zx, y_p,
+            (d_mid + b_mid) * t ** 3 / 3, t ** 3 * (b_mid ** 3 + d_mid ** 3) / 36,
+            math.sqrt(x_0 * x_0 + y_0 * y_0 + (ix + iy) / area), iy, iy / (b - x_bar), math.sqrt(iy / area),
+            x_bar, zy, x_p, iz, iz / (0.5 * math.hypot(d, b)), math.sqrt(iz / area), tan_alpha, qs, d, b, t]
+
+
+def _rectangular_hss(height, width, t_nom):
+    """
+    Properties of a rectangular HSS with square corners and a design wall
+    thickness of 0.93 times the nominal.
+    """
+    t = 0.93 * t_nom
+    h_in, b_in = height - 2 * t, width - 2 * t
+    area = height * width - h_in * b_in
+    ix = (width * height ** 3 - b_in * h_in ** 3) / 12
+    iy = (height * width ** 3 - h_in * b_in ** 3) / 12
+    zx = (width * height ** 2 - b_in * h_in ** 2) / 4
+    zy = (height * width ** 2 - h_in * b_in ** 2) / 4
+    torsion = 2 * t * (height - t) ** 2 * (width - t) ** 2 / (height + width - 2 * t)
+    return [t, t_nom, 2 * t_nom * (height + width - 2 * t_nom) * STEEL_WEIGHT, area, ix, ix / (height / 2),
+            math.sqrt(ix / area), zx, iy, iy / (width / 2), math.sqrt(iy / area), zy, torsion,
+            2 * t * (height - t) * (width - t) - 4.5 * (4 - math.pi) * t ** 3, height, width]
+
+
+def _build_sections():
+    """
+    Return {edition: {family: [names]}} and {(family, name): properties}.
+    """
+    properties = {}
+
+    def w_shapes(series):
+        names = []
+        for depth, weights in series.items():
+            for weight in weights:
+                name = f"W{depth}x{weight:g}"
+                if ("W-Shapes", name) not in properties:
+                    properties[("W-Shapes", name)] = _w_shape(depth, weight)
+                names.append(name)
+        return names
+
+    angles = []
+    for d, b, t_min, t_max in ANGLE_SERIES:
+        d, b = _inches(d), _inches(b)
+        t = _inches(t_min)
+        while t <= _inches(t_max):
+            name = f"L{_fraction_label(d)}x{_fraction_label(b)}x{_fraction_label(t)}"
+            properties[("Angles", name)] = _angle(float(d), float(b), float(t))
+            angles.append(name)
+            t += Fraction(1, 16)
+
+    hss = []
+    for height, width in HSS_SIZES:
+        for label in HSS_THICKNESSES:
+            t = _inches(label)
+            if t > Fraction(width, 5):
+                break
+            name = f"HSS{height}x{width}x{_fraction_label(t)}"
+            properties[("Rectangular HSS", name)] = _rectangular_hss(height, width, float(t))
+            hss.append(name)
+
+    w_14th = w_shapes(W_SERIES)
+    # Section names must be unique within a list, as in the published tables
+    w_15th = list(dict.fromkeys(w_14th + w_shapes(W_SERIES_15TH)))
+    shape_names = {
+        "AISC 14th": {"W-Shapes": w_14th, "Angles": angles, "Rectangular HSS": hss},
+        "AISC 15th": {"W-Shapes": w_15th, "Angles": angles, "Rectangular HSS": hss},
+    }
+    properties = {key: [round(float(value), 4) for value in values] for key, values in properties.items()}
+    return shape_names, properties
+
+
+SHAPE_NAMES, SECTION_PROPERTIES = _build_sections()
+
+# Bolt diameter: standard, oversize, short slot and long slot hole dimensions (AISC Table J3.3)
+IMPERIAL_HOLES = {
+    0.5: ("9/16", "5/8", "9/16 x 11/16", "9/16 x 1 1/4"),
+    0.625: ("11/16", "13/16", "11/16 x 7/8", "11/16 x 1 9/16"),
+    0.75: ("13/16", "15/16", "13/16 x 1", "13/16 x 1 7/8"),
+    0.875: ("15/16", "1 1/16", "15/16 x 1 1/8", "15/16 x 2 3/16"),
+    1.0: ("1 1/8", "1 1/4", "1 1/8 x 1 5/16", "1 1/8 x 2 1/2"),
+}
+# Table J3.3M
+METRIC_HOLES = {
+    16: (18, 20, (18, 22), (18, 40)),
+    20: (22, 24, (22, 26), (22, 50)),
+    22: (24, 28, (24, 30), (24, 55)),
+    24: (27, 30, (27, 32), (27, 60)),
+    27: (30, 35, (30, 37), (30, 67)),
+    30: (33, 38, (33, 40), (33, 75)),
+}
+HOLE_TYPE_INDEX = {"Standard": 0, "Oversize": 1, "Short Slot": 2, "Long Slot": 3}
+# Specification page of Tables J3.3 and J3.3M as the real module cites it for
+# AISC 14th; the stub gives the same page for every edition
+TABLE_PAGE = "16.1-121"
+
+
+def _sleep(seconds):
+    if LATENCY_SCALE > 0:
+        time.sleep(seconds * LATENCY_SCALE)
+
+
+def get_shape_names():
+    _sleep(SHAPE_NAMES_LATENCY)
+    return json.dumps(SHAPE_NAMES)
+
+
+def get_member_section_size(edition, family, name):
+    _sleep(SECTION_SIZE_LATENCY)
+    return list(SECTION_PROPERTIES.get((family, name), []))
+
+
+def _imperial_hole(diameter, hole_type):
+    index = HOLE_TYPE_INDEX[hole_type]
+    if diameter in IMPERIAL_HOLES:
+        dimensions = [_inches(part) for part in IMPERIAL_HOLES[diameter][index].split(" x ")]
+    else:
+        d = Fraction(diameter).limit_denominator(16)
+        # Slots are d + 1/16 wide, as the real module gives "1.3125 in. X 3.125 in." for 1 1/4 in. long slots
+        dimensions = [(d + Fraction(1, 8),), (d + Fraction(5, 16),),
+                      (d + Fraction(1, 16), d + Fraction(3, 8)), (d + Fraction(1, 16), Fraction(5, 2) * d)][index]
+    return " X ".join(f"{float(value):g} in." for value in dimensions)
+
+
+def _metric_hole(diameter, hole_type):
+    index = HOLE_TYPE_INDEX[hole_type]
+    d = int(round(diameter))
+    if d in METRIC_HOLES:
+        dimensions = METRIC_HOLES[d][index]
+    else:
+        dimensions = [d + 3, d + 8, (d + 3, d + 10), (d + 3, int(2.5 * d))][index]
+    if not isinstance(dimensions, tuple):
+        dimensions = (dimensions,)
+    return " X ".join(f"{value} mm" for value in dimensions)
+
+
+def get_hole_info(edition, unit, diameter, hole_type):
+    _sleep(HOLE_INFO_LATENCY)
+    # Same format as the real module: "1.3125 in. X 3.125 in." and
+    # "AISC 14th, 16.1-121, Table J3.3 and J3.3M"
+    if unit == "Imperial Units":
+        content = _imperial_hole(diameter, hole_type)
+    else:
+        content = _metric_hole(diameter, hole_type)
+    reference = f"{edition}, {TABLE_PAGE}, Table J3.3 and J3.3M"
+    return json.dumps({"Hole diameter": {"content": content}, "Hole diameter reference": {"content": reference}})
@@ -0,0 +1,88 @@
+"""
+Shared setup of the benchmark suite.
+
+The suite runs against the pure-Python CET_MODULE stand-in in cet_stub, so
+it runs on any platform. Set CET_BENCH_NATIVE=1 to time the installed
+CET_MODULE instead. Widgets are created on an offscreen Qt platform.
+"""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+PLUGINS_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cet_stub")
+
+if PLUGINS_PATH not in sys.path:
+    sys.path.append(PLUGINS_PATH)
+
+# Imported before cet_common.native looks for the installed module
+if not os.getenv("CET_BENCH_NATIVE"):
+    sys.path.insert(0, STUB_PATH)
+    import CET_MODULE  # noqa: F401
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    QtWidgets = pytest.importorskip("PySide2.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture(scope="session")
+def load_plugin(qapp):
+    """
+    Import a plugin module from its folder the way the host does.
+    """
+    modules = {}
+
+    def load(plugin_name):
+        if plugin_name not in modules:
+            plugin_path = os.path.join(PLUGINS_PATH, plugin_name, "plugin.py")
+            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            modules[plugin_name] = module
+        return modules[plugin_name]
+
+    return load
+
+
+@pytest.fixture
+def make_widget(qapp):
+    """
+    Construct plugin widgets and tear them down after the benchmark.
+    """
+    widgets = []
+
+    def make(module):
+        widget = module.PluginUI()
+        widgets.append(widget)
+        return widget
+
+    yield make
+
+    from PySide2.QtCore import QCoreApplication, QEvent, QThreadPool
+
+    for widget in widgets:
+        widget.teardown()
+        widget.deleteLater()
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+@pytest.fixture
+def wait_for_result(qapp):
+    """
+    Run the event loop until an evaluator has rendered its latest request.
+    """
+    from PySide2.QtCore import QThreadPool
+
+    def wait(evaluator):
+        while evaluator.running or evaluator.pending is not None or evaluator.timer.isActive():
+            qapp.processEvents()
+            QThreadPool.globalInstance().waitForDone()
+
+    return wait
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cet_common.discovery import scan_plugins  # noqa: E402
+from cet_common.schedule import PLUGINS_PATH  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group="discovery")
+
+
+def test_scan_plugins_cold(benchmark, tmp_path):
+    cache_path = str(tmp_path / "plugin_cache.json")
+
+    def remove_cache():
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    plugins = benchmark.pedantic(scan_plugins, args=(PLUGINS_PATH, cache_path), setup=remove_cache, rounds=50)
+    assert [plugin["name"] for plugin in plugins] == ["Member_Property", "Nominal_Hole_Dimension"]
+
+
+def test_scan_plugins_cached(benchmark, tmp_path):
+    cache_path = str(tmp_path / "plugin_cache.json")
+    scan_plugins(PLUGINS_PATH, cache_path)
+
+    plugins = benchmark(scan_plugins, PLUGINS_PATH, cache_path)
+    assert len(plugins) == 2
@@ -0,0 +1,107 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cet_common.aisc import FAMILIES  # noqa: E402
+from cet_common.section_cache import get_section_cache  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group="Member_Property")
+
+
+@pytest.fixture
+def plugin(load_plugin):
+    return load_plugin("Member_Property")
+
+
+@pytest.fixture
+def widget(plugin, make_widget, wait_for_result):
+    widget = make_widget(plugin)
+    wait_for_result(widget.evaluator)
+    return widget
+
+
+def test_construct(benchmark, plugin, make_widget):
+    benchmark(make_widget, plugin)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_create_property_table(benchmark, widget, family):
+    widget.shape_list_combo.setCurrentText(family)
+    section = widget.section_list_combo.currentText()
+    values = widget.get_section_properties("AISC 14th", family, section)
+    derived = widget.get_derived_values("AISC 14th", family, section, "A992")
+
+    html = benchmark(widget.create_property_table, values, derived)
+    assert 'id="property-rows"' in html
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("cache", ["cold", "warm"])
+def test_update_cycle(benchmark, widget, wait_for_result, family, cache):
+    """
+    Select the next section and wait until the result is rendered. The page is
+    never loaded offscreen, so rendering stops at the queued JavaScript call.
+    """
+    widget.shape_list_combo.setCurrentText(family)
+    wait_for_result(widget.evaluator)
+    # Start after the current section, so that every round changes the selection
+    indexes = itertools.islice(itertools.cycle(range(widget.section_list_combo.count())), 1, None)
+
+    def select_next():
+        widget.section_list_combo.setCurrentIndex(next(indexes))
+        wait_for_result(widget.evaluator)
+
+    if cache == "cold":
+        benchmark.pedantic(select_next, setup=get_section_cache().clear, rounds=200)
+    else:
+        benchmark(select_next)
+    assert widget.rendered_shape == family
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_derived_values(benchmark, widget, family):
+    """
+    Derived design values of a whole family in one vectorized pass.
+    """
+    pytest.importorskip("numpy")
+    from cet_common.derived_properties import derived_values
+
+    names, values = widget.properties.table("AISC 14th", family)
+    derived = benchmark(derived_values, family, values, "A992")
+    assert len(derived) == len(names)
+
+
+def test_switch_grade(benchmark, widget, wait_for_result):
+    grades = itertools.cycle(["A36", "A992"])
+
+    def switch():
+        widget.grade_combo.setCurrentText(next(grades))
+        wait_for_result(widget.evaluator)
+
+    benchmark(switch)
+
+
+def test_switch_edition(benchmark, widget, wait_for_result):
+    editions = itertools.cycle(["AISC 15th", "AISC 14th"])
+
+    def switch():
+        widget.design_code_combo.setCurrentText(next(editions))
+        wait_for_result(widget.evaluator)
+
+    benchmark(switch)
+
+
+@pytest.mark.parametrize("text", ["W14x", "14x2", "w1422"])
+def test_find_section(benchmark, widget, text):
+    names = benchmark(widget.section_index.search, text)
+    assert names
+
+
+@pytest.mark.parametrize("extension", [".csv", ".npy"])
+def test_export_table(benchmark, widget, tmp_path, extension):
+    if extension == ".npy":
+        pytest.importorskip("numpy")
+    count = benchmark(widget.export_table, str(tmp_path / f"W-Shapes{extension}"), "AISC 14th", "W-Shapes")
+    assert count == widget.section_list_combo.count()
@@ -0,0 +1,60 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cet_common.aisc import HOLE_TYPES, UNITS  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group="Nominal_Hole_Dimension")
+
+
+@pytest.fixture
+def plugin(load_plugin):
+    return load_plugin("Nominal_Hole_Dimension")
+
+
+@pytest.fixture
+def widget(plugin, make_widget, wait_for_result):
+    widget = make_widget(plugin)
+    wait_for_result(widget.evaluator)
+    return widget
+
+
+def test_construct(benchmark, plugin, make_widget):
+    benchmark(make_widget, plugin)
+
+
+@pytest.mark.parametrize("unit", UNITS)
+def test_generate_slot_hole_svg(benchmark, widget, unit):
+    svg = benchmark(widget.generate_slot_hole_svg, 22.0, 50.0, x=100, y=50, width=300, height=400, unit=unit)
+    assert svg.startswith('<svg id="slot-svg"')
+
+
+@pytest.mark.parametrize("unit", UNITS)
+def test_update_cycle(benchmark, widget, wait_for_result, unit):
+    """
+    Step through every diameter and hole type and wait until each result is
+    rendered. The page is never loaded offscreen, so rendering stops at the
+    queued JavaScript call.
+    """
+    widget.unit_list_combo.setCurrentText(unit)
+    wait_for_result(widget.evaluator)
+    selections = itertools.cycle(itertools.product(range(widget.diameter_list_combo.count()), HOLE_TYPES))
+
+    def select_next():
+        diameter, hole_type = next(selections)
+        widget.diameter_list_combo.setCurrentIndex(diameter)
+        widget.hole_type_combo.setCurrentText(hole_type)
+        wait_for_result(widget.evaluator)
+
+    benchmark(select_next)
+    assert "setHole" in widget.bridge.pending
+
+
+@pytest.mark.parametrize("extension", [".csv", ".npy"])
+def test_export_table(benchmark, widget, tmp_path, extension):
+    if extension == ".npy":
+        pytest.importorskip("numpy")
+    count = benchmark(widget.export_table, str(tmp_path / f"holes{extension}"))
+    assert count == 192
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+np = pytest.importorskip("numpy")
+
+from cet_common.aisc import IMPERIAL_DIAMETERS, METRIC_DIAMETERS  # noqa: E402
+from cet_common.units import parse_lengths, parse_slots  # noqa: E402
+
+pytestmark = pytest.mark.benchmark(group="units")
+
+# A 10,000-bolt schedule mixing both unit systems
+SCHEDULE = np.resize(np.array(IMPERIAL_DIAMETERS + METRIC_DIAMETERS), 10000)
+
+
+def test_parse_lengths(benchmark):
+    values = benchmark(parse_lengths, SCHEDULE, "mm")
+    assert values.shape == (10000,) and not np.isnan(values).any()
+
+
+def test_parse_slots(benchmark):
+    slots = np.resize(np.array(["0.8125 x 1.8750", "22 x 50", "0.9375"]), 10000)
+    widths, lengths = benchmark(parse_slots, slots)
+    assert np.isnan(widths[2::3]).all()
@@ -0,0 +1,5 @@
+"""
+Shared helpers for the CET.SteelConnDesign plugin host and plugins.
+
+This folder has no plugin.py, so the host does not list it as a plugin.
+"""
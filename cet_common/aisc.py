@@ -0,0 +1,51 @@
+"""
+AISC editions, shape families and property symbols shared by the plugins.
+"""
+
+EDITIONS = ("AISC 13th", "AISC 14th", "AISC 15th")
+FAMILIES = ("W-Shapes", "Angles", "Rectangular HSS")
+
+# Property symbols per shape family, in the order returned by get_member_section_size
+COLUMNS = {
+    "W-Shapes": ["A", "d", "d_{det}", "t_w", "t_{w,det}", "b_f", "b_{f,det}", "t_f", "t_{f,det}", "k_{des}", "k_{det}", "k_1", "T", "g", "W_t", "I_x", "S_x", "r_x", "Z_x", "I_y", "S_y", "r_y", "Z_y", "J", "C_w"],
+    "Angles": ["k", "W_t", "A", "I_x", "S_x", "r_x", "\\overline{y}", "Z_x", "y_p", "J", "Cw", "r_o", "I_y", "S_y", "r_y", "\\overline{x}", "Z_y", "x_p", "I_z", "S_z", "r_z", "T_{\\alpha}", "Qs", "d", "B", "t"],
+    "Default": ["t_{des}", "t_{nom}", "W", "A", "I_x", "S_x", "r_x", "Z_x", "I_y", "S_y", "r_y", "Z_y", "J", "C", "H_t", "B"]
+}
+
+
+def family_columns(family):
+    return COLUMNS.get(family, COLUMNS["Default"])
+
+
+# Design values derived from the properties for a steel grade (cet_common.derived_properties)
+DERIVED_COLUMNS = {
+    "W-Shapes": ["P_y", "M_p", "M_y", "b_f/2t_f", "h/t_w", "L_p", "L_r"],
+    "Angles": ["P_y", "M_p", "M_y", "b/t"],
+    "Default": ["P_y", "M_p", "M_y", "b/t", "h/t", "L_p", "L_r"]
+}
+DERIVED_UNITS = {"P_y": "kips", "M_p": "kip-ft", "M_y": "kip-ft", "L_p": "ft", "L_r": "ft"}
+
+# Minimum yield stress (ksi) of the steel grades; A58 is taken as A588
+GRADES = {"A992": 50.0, "A58": 50.0, "A36": 36.0}
+E = 29000.0  # ksi
+
+
+def derived_columns(family):
+    return DERIVED_COLUMNS.get(family, DERIVED_COLUMNS["Default"])
+
+
+def names_edition(edition):
+    # The 13th edition uses the 14th edition section names
+    return "AISC 14th" if edition == "AISC 13th" else edition
+
+
+# Bolt diameters and hole types of AISC Tables J3.3 and J3.3M
+UNITS = ("Imperial Units", "Metric Units")
+IMPERIAL_DIAMETERS = ("1/2 in.", "5/8 in.", "3/4 in.", "7/8 in.", "1 in.", "1 1/8 in.", "1 1/4 in.", "1 1/2 in.")
+METRIC_DIAMETERS = ("16 mm", "20 mm", "22 mm", "24 mm", "27 mm", "30 mm", "33 mm", "36 mm")
+HOLE_TYPES = ("Standard", "Oversize", "Short Slot", "Long Slot")
+SLOT_TYPES = ("Short Slot", "Long Slot")
+
+
+def unit_diameters(unit):
+    return IMPERIAL_DIAMETERS if unit == "Imperial Units" else METRIC_DIAMETERS
@@ -0,0 +1,90 @@
+"""
+Command-line batch lookups that stream CSV in and out.
+
+    python -m cet_common.cli sections members.csv -o properties.csv
+    python -m cet_common.cli holes bolts.csv > holes.csv
+
+Input columns are edition, family, section and optionally grade (sections)
+or edition, unit, diameter, hole_type (holes). Rows with a grade also get
+the derived design values (Py, Mp, My, width-to-thickness ratios, Lp, Lr).
+Columns missing from the input can be given once for every row with
+--edition, --family, --grade, --unit or --hole-type.
+"""
+import argparse
+import csv
+import sys
+import time
+
+
+def open_lookup(kind):
+    """
+    Return (process_rows, key fields, output fields) for a lookup kind.
+    """
+    if kind == "sections":
+        from cet_common import member_properties as lookup
+    else:
+        from cet_common import hole_dimensions as lookup
+    return lookup.process_rows, lookup.KEY_FIELDS, lookup.OUTPUT_FIELDS
+
+
+def read_rows(reader, defaults):
+    for row in reader:
+        for field, value in defaults.items():
+            if value is not None and not row.get(field):
+                row[field] = value
+        yield row
+
+
+def write_rows(stream, rows, fieldnames):
+    writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch section-property and bolt-hole lookups.")
+    parser.add_argument("kind", choices=["sections", "holes"])
+    parser.add_argument("input", nargs="?", default="-", help="Input CSV file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output CSV file (default: stdout)")
+    parser.add_argument("--edition")
+    parser.add_argument("--family")
+    parser.add_argument("--grade")
+    parser.add_argument("--unit")
+    parser.add_argument("--hole-type")
+    args = parser.parse_args(argv)
+
+    process_rows, key_fields, output_fields = open_lookup(args.kind)
+    defaults = {"edition": args.edition, "family": args.family, "grade": args.grade, "unit": args.unit,
+                "hole_type": args.hole_type}
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    reader = csv.DictReader(input_stream)
+    # Checked before the output is opened, so a bad input does not truncate it
+    missing = [field for field in key_fields if field not in (reader.fieldnames or []) and not defaults.get(field)]
+    if missing:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        options = ", ".join("--" + field.replace("_", "-") for field in missing)
+        parser.error(f"The input has no {', '.join(missing)} column; add it or set it with {options}.")
+
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        start = time.perf_counter()
+        rows = process_rows(read_rows(reader, defaults))
+        count = write_rows(output_stream, rows, output_fields)
+        elapsed = time.perf_counter() - start
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    print(f"{count} rows in {elapsed:.2f} s ({count / max(elapsed, 1e-9):,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
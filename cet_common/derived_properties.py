@@ -0,0 +1,169 @@
+"""
+Design values derived from the section properties for a steel grade.
+
+    values = derived_values("W-Shapes", table, "A992")
+
+For every section of a family at once: the axial yield strength Py = Fy A,
+the plastic and yield moments Mp = Fy Zx and My = Fy Sx, the width-to-
+thickness ratios of AISC 360 Table B4.1 and the limiting unbraced lengths
+Lp and Lr of AISC 360 F2 (W-shapes) and F7 (HSS). The symbols, units and
+grades are in cet_common.aisc.DERIVED_COLUMNS.
+"""
+import threading
+
+import numpy as np
+
+from cet_common.aisc import E, GRADES, derived_columns, family_columns
+from cet_common.symbols import plain_symbol
+from cet_common.units import to_float
+
+
+def yield_stress(grade):
+    try:
+        return GRADES[grade]
+    except KeyError:
+        raise KeyError(f"Unknown grade '{grade}'. Available: {', '.join(GRADES)}") from None
+
+
+def _w_shape(p, fy):
+    # h is taken as d - 2 kdes, and c = 1 for doubly symmetric I-shapes
+    rts = np.sqrt(np.sqrt(p["Iy"] * p["Cw"]) / p["Sx"])
+    ho = p["d"] - p["tf"]
+    jc = p["J"] / (p["Sx"] * ho)
+    return {
+        "P_y": fy * p["A"],
+        "M_p": fy * p["Zx"] / 12,
+        "M_y": fy * p["Sx"] / 12,
+        "b_f/2t_f": p["bf"] / (2 * p["tf"]),
+        "h/t_w": (p["d"] - 2 * p["kdes"]) / p["tw"],
+        "L_p": 1.76 * p["ry"] * np.sqrt(E / fy) / 12,
+        "L_r": 1.95 * rts * E / (0.7 * fy) * np.sqrt(jc + np.sqrt(jc ** 2 + 6.76 * (0.7 * fy / E) ** 2)) / 12,
+    }
+
+
+def _angle(p, fy):
+    # b/t of the longer leg
+    return {
+        "P_y": fy * p["A"],
+        "M_p": fy * p["Zx"] / 12,
+        "M_y": fy * p["Sx"] / 12,
+        "b/t": np.fmax(p["d"], p["B"]) / p["t"],
+    }
+
+
+def _rectangular_hss(p, fy):
+    # Flat widths are the outside dimensions less three times the design wall thickness
+    mp = fy * p["Zx"]
+    sqrt_ja = np.sqrt(p["J"] * p["A"])
+    return {
+        "P_y": fy * p["A"],
+        "M_p": mp / 12,
+        "M_y": fy * p["Sx"] / 12,
+        "b/t": (p["B"] - 3 * p["tdes"]) / p["tdes"],
+        "h/t": (p["Ht"] - 3 * p["tdes"]) / p["tdes"],
+        "L_p": 0.13 * E * p["ry"] * sqrt_ja / mp / 12,
+        "L_r": 2 * E * p["ry"] * sqrt_ja / (0.7 * fy * p["Sx"]) / 12,
+    }
+
+
+FORMULAS = {
+    "W-Shapes": _w_shape,
+    "Angles": _angle,
+    "Default": _rectangular_hss,
+}
+
+
+def derived_values(family, values, grade):
+    """
+    Return the (sections x derived columns) array of a family from its
+    (sections x properties) array, in the order of derived_columns(family).
+    Missing properties give NaN.
+    """
+    values = np.asarray(values, dtype=float).reshape(-1, len(family_columns(family)))
+    properties = {plain_symbol(symbol): values[:, i] for i, symbol in enumerate(family_columns(family))}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derived = FORMULAS.get(family, FORMULAS["Default"])(properties, yield_stress(grade))
+    result = np.column_stack([derived[symbol] for symbol in derived_columns(family)])
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+class DerivedPropertyService:
+    """
+    Derived design values by (edition, shape family, section, grade).
+
+    A single section is computed from its cached properties on first use.
+    Whole families are computed in one vectorized pass for batch lookups,
+    after which single sections are read from that table.
+    """
+    def __init__(self, properties):
+        self.properties = properties  # SectionPropertyService
+        self._tables = {}  # (edition, family, grade) -> ({section: row}, array)
+        self._sections = {}  # (edition, family, section, grade) -> tuple
+        self._lock = threading.Lock()
+
+    def family_table(self, edition, family, grade):
+        """
+        Return ({section: row}, sections x derived columns array) of a whole
+        edition and family.
+        """
+        key = (edition, family, grade)
+        with self._lock:
+            table = self._tables.get(key)
+        if table is None:
+            names, values = self.properties.table(edition, family)
+            table = ({name: row for row, name in enumerate(names)}, derived_values(family, values, grade))
+            with self._lock:
+                self._tables[key] = table
+        return table
+
+    def get(self, edition, family, section, grade):
+        key = (edition, family, section, grade)
+        with self._lock:
+            values = self._sections.get(key)
+            table = self._tables.get((edition, family, grade))
+        if values is not None:
+            return values
+        if table is not None and section in table[0]:
+            return tuple(table[1][table[0][section]].tolist())
+
+        properties = self.properties.get(edition, family, section)
+        row = np.full(len(family_columns(family)), np.nan)
+        row[:len(properties)] = [to_float(value) for value in properties[:len(row)]]
+        values = tuple(derived_values(family, row, grade)[0].tolist())
+        with self._lock:
+            self._sections[key] = values
+        return values
+
+    def get_named(self, edition, family, section, grade):
+        """
+        Derived values of one section as a {plain symbol: value} dictionary.
+        """
+        values = self.get(edition, family, section, grade)
+        return dict(zip((plain_symbol(symbol) for symbol in derived_columns(family)), values))
+
+    def batch(self, editions, families, sections, grades, fields):
+        """
+        Return {field: float array} of the derived values of many sections,
+        for every plain name in fields, NaN where a value does not apply to
+        the family or the edition, family, section or grade is unknown.
+        """
+        count = len(sections)
+        result = {field: np.full(count, np.nan) for field in fields}
+
+        groups = {}
+        for i, key in enumerate(zip(editions, families, grades)):
+            groups.setdefault(key, []).append(i)
+
+        for (edition, family, grade), indices in groups.items():
+            try:
+                rows_by_name, table = self.family_table(edition, family, grade)
+            except KeyError:
+                # Unknown edition, family or grade: the rows stay NaN
+                continue
+            indices = np.asarray(indices)
+            rows = np.array([rows_by_name.get(sections[i], -1) for i in indices])
+            found = rows >= 0
+            for column, symbol in enumerate(derived_columns(family)):
+                result[plain_symbol(symbol)][indices[found]] = table[rows[found], column]
+        return result
@@ -0,0 +1,170 @@
+import ast
+import json
+import os
+
+# Module-level fields read from plugin.py (or plugin.json) without executing it.
+# row_processor is optional: "module:function" of a Qt-free batch function
+# taking an iterable of row dictionaries and yielding result dictionaries.
+METADATA_FIELDS = ("author", "description", "category", "load_order", "row_processor")
+REQUIRED_FIELDS = ("description", "category", "load_order")
+
+PLUGIN_FILE = "plugin.py"
+MANIFEST_FILE = "plugin.json"
+CACHE_FILE = ".plugin_cache.json"
+
+
+def read_plugin_metadata(plugin_path):
+    """
+    Read the metadata fields assigned as literals at module level in plugin.py.
+    Nothing in the file is imported or executed.
+    """
+    with open(plugin_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=plugin_path)
+
+    metadata = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target = node.target
+        else:
+            continue
+        if isinstance(target, ast.Name) and target.id in METADATA_FIELDS:
+            try:
+                metadata[target.id] = ast.literal_eval(node.value)
+            except ValueError:
+                # Computed values cannot be read statically
+                pass
+    return metadata
+
+
+def read_manifest(manifest_path):
+    """
+    Read the optional plugin.json sidecar. Its fields override plugin.py.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return {key: manifest[key] for key in METADATA_FIELDS if key in manifest}
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def plugin_signature(plugin_path):
+    """
+    mtime and size of a plugin's plugin.py and plugin.json (None if absent),
+    which identify an unchanged plugin in the on-disk caches.
+    """
+    manifest_path = os.path.join(os.path.dirname(plugin_path), MANIFEST_FILE)
+    return [_file_signature(plugin_path), _file_signature(manifest_path)]
+
+
+class SignatureCache:
+    """
+    On-disk JSON cache of a value per plugin, keyed by plugin_signature so
+    the value of an unchanged plugin is reused. The file is written by save()
+    only when an entry changed, and ignored if it was written with other
+    fields.
+    """
+    def __init__(self, cache_path, fields=None):
+        self.cache_path = cache_path
+        self.fields = fields
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("fields") == fields:
+                self.entries = dict(cache["plugins"])
+        except (OSError, ValueError, TypeError, AttributeError, KeyError):
+            self.entries = {}
+
+    def get(self, plugin_path, signature):
+        entry = self.entries.get(plugin_path)
+        if isinstance(entry, dict) and entry.get("signature") == signature:
+            return entry.get("value")
+        return None
+
+    def put(self, plugin_path, signature, value):
+        self.entries[plugin_path] = {"signature": signature, "value": value}
+        self.dirty = True
+
+    def remove(self, plugin_path):
+        if plugin_path in self.entries:
+            del self.entries[plugin_path]
+            self.dirty = True
+
+    def prune(self, plugin_paths):
+        for path in list(self.entries):
+            if path not in plugin_paths:
+                self.remove(path)
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"fields": self.fields, "plugins": self.entries}, f, indent=1)
+            self.dirty = False
+        except OSError:
+            # A read-only plugin folder only costs a re-parse or re-check next time
+            pass
+
+
+class MetadataCache(SignatureCache):
+    """
+    Plugin metadata by the mtime and size of plugin.py and plugin.json, so
+    an unchanged plugin is never parsed twice. Entries written for a
+    different set of fields are stale.
+    """
+    def __init__(self, cache_path):
+        super().__init__(cache_path, list(METADATA_FIELDS))
+
+
+def scan_plugins(plugin_dir, cache_path=None):
+    """
+    Scan the plugin directory and return the metadata of every plugin,
+    sorted by load order.
+    """
+    if cache_path is None:
+        cache_path = os.path.join(plugin_dir, CACHE_FILE)
+    cache = MetadataCache(cache_path)
+
+    plugins = []
+    seen = set()
+    for plugin_name in os.listdir(plugin_dir):
+        plugin_path = os.path.join(plugin_dir, plugin_name, PLUGIN_FILE)
+        if not os.path.isfile(plugin_path):
+            continue
+        seen.add(plugin_path)
+
+        manifest_path = os.path.join(plugin_dir, plugin_name, MANIFEST_FILE)
+        signature = plugin_signature(plugin_path)
+        metadata = cache.get(plugin_path, signature)
+        if metadata is None:
+            try:
+                metadata = read_plugin_metadata(plugin_path)
+                if signature[1] is not None:
+                    metadata.update(read_manifest(manifest_path))
+            except (OSError, SyntaxError, ValueError) as e:
+                print(f"Error reading plugin {plugin_name}: {e}")
+                continue
+            cache.put(plugin_path, signature, metadata)
+
+        # Check for required metadata
+        if all(key in metadata for key in REQUIRED_FIELDS):
+            plugin = {"name": plugin_name, "path": plugin_path}
+            plugin.update(metadata)
+            plugins.append(plugin)
+
+    cache.prune(seen)
+    cache.save()
+
+    # Sort plugins by load order
+    plugins.sort(key=lambda x: x["load_order"])
+    return plugins
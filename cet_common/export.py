@@ -0,0 +1,113 @@
+"""
+Streaming export of lookup results to CSV or NumPy (.npy) files.
+
+Rows are written one at a time as a generator yields them, so a table is
+never built in memory or as HTML first. A .npy file holds a structured
+array with one named column per field, and is filled through a memory map,
+so downstream tools can load it without parsing:
+
+    table = np.load("W-Shapes.npy", mmap_mode="r")
+    table["section"], table["Zx"]
+"""
+import itertools
+import os
+import time
+
+from cet_common.cli import write_rows
+from cet_common.units import to_float
+
+# File dialog filters and the extension each one writes
+EXPORT_FORMATS = {"CSV files (*.csv)": ".csv", "NumPy files (*.npy)": ".npy"}
+EXPORT_FILTERS = ";;".join(EXPORT_FORMATS)
+
+CHUNK_SIZE = 1024
+
+
+def write_csv(path, rows, fields):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        return write_rows(f, rows, fields)
+
+
+def _record(row, fields, text_fields):
+    record = []
+    for field in fields:
+        value = row.get(field)
+        if field in text_fields:
+            text = "" if value is None else str(value)
+            if len(text) > text_fields[field]:
+                raise ValueError(f"The {field} '{text}' is longer than {text_fields[field]} characters.")
+            record.append(text)
+        else:
+            record.append(to_float(value))
+    return tuple(record)
+
+
+def write_npy(path, rows, fields, count, text_fields):
+    """
+    Write count rows to a structured .npy array. Fields in text_fields
+    ({field: maximum length}) are stored as strings, the others as float64
+    with NaN for missing values.
+    """
+    import numpy as np
+    from numpy.lib.format import open_memmap
+
+    dtype = np.dtype([(field, f"U{text_fields[field]}" if field in text_fields else "f8") for field in fields])
+    table = open_memmap(path, mode="w+", dtype=dtype, shape=(count,))
+    written = 0
+    rows = iter(rows)
+    try:
+        while True:
+            chunk = [_record(row, fields, text_fields) for row in itertools.islice(rows, CHUNK_SIZE)]
+            if not chunk:
+                break
+            if written + len(chunk) > count:
+                raise ValueError(f"More than the expected {count} rows.")
+            table[written:written + len(chunk)] = np.array(chunk, dtype=dtype)
+            written += len(chunk)
+        table.flush()
+    finally:
+        del table
+    if written != count:
+        raise ValueError(f"Expected {count} rows, got {written}.")
+    return written
+
+
+def export_rows(path, rows, fields, count, text_fields):
+    """
+    Write rows (dictionaries) to path as CSV or .npy, by its extension, and
+    return the number of rows written. A partly written file is removed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORT_FORMATS.values():
+        raise ValueError(f"Cannot export to '{extension}' files. Use {' or '.join(EXPORT_FORMATS.values())}.")
+    try:
+        if extension == ".npy":
+            return write_npy(path, rows, fields, count, text_fields)
+        return write_csv(path, rows, fields)
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+
+def export_with_dialog(parent, title, default_name, export_table, noun, status_label):
+    """
+    Ask for a CSV or .npy file name, write it with export_table(path) and
+    show "<count> <noun> exported in <ms> ms" in status_label. Errors are
+    shown in a message box.
+    """
+    from PySide2.QtWidgets import QFileDialog, QMessageBox
+
+    path, selected_filter = QFileDialog.getSaveFileName(parent, title, default_name, EXPORT_FILTERS)
+    if not path:
+        return
+    if not os.path.splitext(path)[1]:
+        path += EXPORT_FORMATS.get(selected_filter, ".csv")
+    try:
+        start = time.perf_counter()
+        count = export_table(path)
+        elapsed = (time.perf_counter() - start) * 1000
+    except (OSError, ValueError) as e:
+        QMessageBox.warning(parent, title, str(e))
+        return
+    status_label.setText(f"{count} {noun} exported in {elapsed:.0f} ms")
@@ -0,0 +1,119 @@
+"""
+Headless nominal hole lookups used by the Nominal_Hole_Dimension plugin and
+by scripts. Dimensions come from the precomputed hole table when it exists
+and from CET_MODULE otherwise.
+"""
+from cet_common.hole_table import all_hole_keys, compute_hole_dimension, load_hole_table
+from cet_common.native import load_cet_module
+from cet_common.rows import check_key_fields
+from cet_common.units import parse_lengths
+
+KEY_FIELDS = ["edition", "unit", "diameter", "hole_type"]
+RESULT_FIELDS = ["hole_dimension", "reference", "slot_width", "slot_length"]
+OUTPUT_FIELDS = KEY_FIELDS + RESULT_FIELDS + ["error"]
+
+# Maximum lengths of the text fields in binary exports; slot sizes are floats
+TEXT_FIELDS = {"edition": 16, "unit": 16, "diameter": 16, "hole_type": 16, "hole_dimension": 32, "reference": 64}
+EXPORT_FIELDS = KEY_FIELDS + RESULT_FIELDS
+
+_service = None
+
+
+class HoleDimensionService:
+    """
+    Nominal hole dimensions by (edition, unit, diameter label, hole type).
+    """
+    def __init__(self, hole_table=None, cet_module=None):
+        if hole_table is None and cet_module is None:
+            raise ValueError("Either the hole table or CET_MODULE is required.")
+        self.hole_table = hole_table
+        self.cet_module = cet_module
+        self._computed = {}
+
+    def get(self, edition, unit, diameter, hole_type):
+        key = (edition, unit, diameter, hole_type)
+        if self.hole_table is not None and key in self.hole_table.entries:
+            return self.hole_table.entries[key]
+        if self.cet_module is None:
+            raise KeyError(f"No hole dimension for {key}")
+        # Outside the table (or without it) fall back to CET_MODULE once per key
+        if key not in self._computed:
+            self._computed[key] = compute_hole_dimension(self.cet_module, *key)
+        return self._computed[key]
+
+    def batch(self, editions, units, diameters, hole_types):
+        """
+        Look up many holes at once. Returns a column dictionary (the layout
+        pandas.DataFrame accepts) with slot sizes as float arrays, NaN for
+        round holes. Unknown combinations get None for the hole dimension and
+        reference and NaN for the slot sizes.
+        """
+        import numpy as np
+
+        result = {"edition": list(editions), "unit": list(units),
+                  "diameter": list(diameters), "hole_type": list(hole_types)}
+        holes = [self._get_or_none(*key) for key in zip(result["edition"], result["unit"],
+                                                        result["diameter"], result["hole_type"])]
+        result["diameter_value"] = parse_lengths(result["diameter"])
+        result["hole_dimension"] = [None if hole is None else hole.content for hole in holes]
+        result["reference"] = [None if hole is None else hole.reference for hole in holes]
+        result["slot_width"] = np.array([np.nan if hole is None or hole.slot_width is None else hole.slot_width
+                                         for hole in holes])
+        result["slot_length"] = np.array([np.nan if hole is None or hole.slot_length is None else hole.slot_length
+                                          for hole in holes])
+        return result
+
+    def _get_or_none(self, edition, unit, diameter, hole_type):
+        try:
+            return self.get(edition, unit, diameter, hole_type)
+        except (KeyError, ValueError, RuntimeError):
+            return None
+
+    def process_rows(self, rows):
+        """
+        Stream {edition, unit, diameter, hole_type} dictionaries into
+        dictionaries with the key fields followed by RESULT_FIELDS. Unknown
+        combinations and rows missing a key field get an "error" field
+        instead of raising.
+        """
+        for row in rows:
+            output = {field: row.get(field) for field in KEY_FIELDS}
+            try:
+                check_key_fields(output, KEY_FIELDS)
+                hole = self.get(*(output[field] for field in KEY_FIELDS))
+                output.update(zip(RESULT_FIELDS, hole))
+            except (KeyError, ValueError, RuntimeError) as e:
+                output["error"] = str(e) or type(e).__name__
+            yield output
+
+    def iter_all(self):
+        """
+        Stream the output rows (as process_rows yields them) of every
+        edition, unit system, diameter and hole type, for exports.
+        """
+        return self.process_rows(dict(zip(KEY_FIELDS, key)) for key in all_hole_keys())
+
+
+def hole_count():
+    return sum(1 for _ in all_hole_keys())
+
+
+def open_hole_service():
+    """
+    Return a service backed by the hole table, or by CET_MODULE when the
+    table has not been generated.
+    """
+    hole_table = load_hole_table()
+    cet_module = load_cet_module() if hole_table is None else None
+    return HoleDimensionService(hole_table=hole_table, cet_module=cet_module)
+
+
+def process_rows(rows):
+    """
+    Row processor for batch runs; the service (and its data) is opened once
+    per process.
+    """
+    global _service
+    if _service is None:
+        _service = open_hole_service()
+    return _service.process_rows(rows)
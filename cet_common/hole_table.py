@@ -0,0 +1,121 @@
+"""
+Precomputed nominal hole dimensions (AISC Tables J3.3 and J3.3M).
+
+The whole domain is 3 editions x 2 unit systems x 8 diameters x 4 hole types,
+so it is generated once from CET_MODULE.get_hole_info and saved as JSON
+next to the Nominal_Hole_Dimension plugin. The table is not in the
+repository: build it on a Windows machine with CET_MODULE.cp38-win_amd64.pyd
+(the benchmark stand-in does not return the published values), and ship it
+with the plugin from there:
+
+    python -m cet_common.hole_table build [path]
+    python -m cet_common.hole_table validate [path]
+"""
+import json
+import os
+import sys
+from collections import namedtuple
+
+from cet_common.aisc import EDITIONS, HOLE_TYPES, SLOT_TYPES, UNITS, unit_diameters
+from cet_common.units import extract_and_format_dimensions, fraction_to_decimal
+
+# Slot width and length are in the unit system of the entry (in. or mm), None for round holes
+HoleDimension = namedtuple("HoleDimension", ["content", "reference", "slot_width", "slot_length"])
+
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "Nominal_Hole_Dimension", "hole_table.json")
+
+
+def compute_hole_dimension(cet_module, edition, unit, diameter, hole_type):
+    """
+    Query CET_MODULE for one hole. diameter is a label such as "1 1/8 in.".
+    """
+    results = json.loads(cet_module.get_hole_info(edition, unit, fraction_to_decimal(diameter), hole_type))
+    content = results["Hole diameter"]["content"]
+    reference = results["Hole diameter reference"]["content"]
+    if hole_type in SLOT_TYPES:
+        slot_width, slot_length = extract_and_format_dimensions(content)
+    else:
+        slot_width, slot_length = None, None
+    return HoleDimension(content, reference, slot_width, slot_length)
+
+
+def all_hole_keys():
+    for edition in EDITIONS:
+        for unit in UNITS:
+            for diameter in unit_diameters(unit):
+                for hole_type in HOLE_TYPES:
+                    yield edition, unit, diameter, hole_type
+
+
+class HoleTable:
+    """
+    Hole dimensions indexed by (edition, unit, diameter label, hole type).
+    """
+    def __init__(self, entries):
+        self.entries = dict(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries.items())
+
+    def lookup(self, edition, unit, diameter, hole_type):
+        return self.entries[(edition, unit, diameter, hole_type)]
+
+    @classmethod
+    def build(cls, cet_module):
+        return cls((key, compute_hole_dimension(cet_module, *key)) for key in all_hole_keys())
+
+    def validate(self, cet_module):
+        """
+        Return the keys whose entry differs from CET_MODULE or is missing.
+        """
+        return [key for key in all_hole_keys()
+                if self.entries.get(key) != compute_hole_dimension(cet_module, *key)]
+
+    def save(self, path=DEFAULT_TABLE_PATH):
+        rows = [dict(zip(("edition", "unit", "diameter", "hole_type"), key), **hole._asdict())
+                for key, hole in self.entries.items()]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": rows}, f, indent=1)
+
+    @classmethod
+    def load(cls, path=DEFAULT_TABLE_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)["entries"]
+        return cls(((row["edition"], row["unit"], row["diameter"], row["hole_type"]),
+                    HoleDimension(row["content"], row["reference"], row["slot_width"], row["slot_length"]))
+                   for row in rows)
+
+
+def load_hole_table(path=DEFAULT_TABLE_PATH):
+    """
+    Return the shipped table, or None if it has not been generated.
+    """
+    if os.path.isfile(path):
+        return HoleTable.load(path)
+    return None
+
+
+if __name__ == "__main__":
+    from cet_common.native import load_cet_module
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("build", "validate"):
+        sys.exit("Usage: python -m cet_common.hole_table build|validate [path]")
+    cet_module = load_cet_module()
+    if cet_module is None:
+        sys.exit("CET_MODULE is required to build or validate the hole table.")
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_TABLE_PATH
+
+    if sys.argv[1] == "build":
+        table = HoleTable.build(cet_module)
+        table.save(path)
+        print(f"Wrote {len(table)} hole dimensions to {path}")
+    else:
+        mismatches = HoleTable.load(path).validate(cet_module)
+        for key in mismatches:
+            print("Mismatch:", *key)
+        print(f"{len(mismatches)} mismatches")
+        sys.exit(1 if mismatches else 0)
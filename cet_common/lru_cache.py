@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe LRU cache with an optional time-to-live. Values are
+    built outside the lock on a miss, so a slow build does not block hits.
+    """
+    def __init__(self, maxsize=256, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl  # Seconds, or None to keep entries until evicted
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, time stored)
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """
+        Return the cached value for key, calling build(*key) only on a miss
+        or after the entry expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stamp = entry
+                if self.ttl is None or time.monotonic() - stamp < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+
+        value = build(*key)
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, predicate=None):
+        """
+        Drop all entries, or only those whose key satisfies predicate(key).
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if predicate is None or predicate(key):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
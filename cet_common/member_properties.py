@@ -0,0 +1,236 @@
+"""
+Headless section-property lookups used by the Member_Property plugin and by
+scripts. Properties come from the exported shape database when it exists
+and from CET_MODULE otherwise, through the shared section cache.
+"""
+import json
+import math
+from functools import lru_cache
+
+from cet_common.aisc import COLUMNS, DERIVED_COLUMNS, derived_columns, family_columns, names_edition
+from cet_common.native import load_cet_module
+from cet_common.rows import check_key_fields
+from cet_common.section_cache import get_section_cache
+from cet_common.symbols import plain_symbol
+from cet_common.units import to_float
+
+# The shape database needs numpy; without it CET_MODULE is used
+try:
+    from cet_common.shape_db import open_shape_db
+except ImportError as e:
+    print(f"Shape database unavailable: {e}")
+    open_shape_db = None
+
+# So do the derived design values; without numpy they are left out
+try:
+    from cet_common.derived_properties import DerivedPropertyService
+except ImportError as e:
+    print(f"Derived design values unavailable: {e}")
+    DerivedPropertyService = None
+
+KEY_FIELDS = ["edition", "family", "section"]
+
+# Union of the plain property names of every family, for a fixed CSV header
+PROPERTY_FIELDS = list(dict.fromkeys(plain_symbol(symbol) for symbols in COLUMNS.values() for symbol in symbols))
+DERIVED_FIELDS = list(dict.fromkeys(plain_symbol(symbol) for symbols in DERIVED_COLUMNS.values() for symbol in symbols))
+OUTPUT_FIELDS = KEY_FIELDS + ["grade"] + PROPERTY_FIELDS + DERIVED_FIELDS + ["error"]
+
+# Maximum lengths of the text fields in binary exports
+TEXT_FIELDS = {"edition": 16, "family": 24, "section": 32, "grade": 8}
+
+_service = None
+
+
+@lru_cache(maxsize=None)
+def family_fields(family):
+    """
+    Plain property names of a shape family, in column order.
+    """
+    return tuple(plain_symbol(symbol) for symbol in family_columns(family))
+
+
+@lru_cache(maxsize=None)
+def export_fields(family):
+    """
+    Fields of a shape family export: the key fields, the grade, and the
+    plain names of its properties and derived values.
+    """
+    derived = [plain_symbol(symbol) for symbol in derived_columns(family)]
+    return tuple(KEY_FIELDS + ["grade"] + list(family_fields(family)) + derived)
+
+
+class SectionPropertyService:
+    """
+    Section properties by (edition, shape family, section).
+    """
+    def __init__(self, shape_db=None, cet_module=None, cache=None):
+        self.shape_db = shape_db
+        self.cache = cache if cache is not None else get_section_cache()
+        if shape_db is not None:
+            self.source = shape_db.get_member_section_size
+        elif cet_module is not None:
+            self.source = cet_module.get_member_section_size
+        else:
+            raise ValueError("Either the shape database or CET_MODULE is required.")
+        self.cet_module = cet_module
+        self.derived = DerivedPropertyService(self) if DerivedPropertyService is not None else None
+        self._shape_names = None
+
+    def shape_names(self):
+        # Read once; CET_MODULE returns the whole list as JSON
+        if self._shape_names is None:
+            if self.shape_db is not None:
+                self._shape_names = self.shape_db.shape_names()
+            else:
+                self._shape_names = json.loads(self.cet_module.get_shape_names())
+        return self._shape_names
+
+    def section_names(self, edition, family):
+        if self.shape_db is not None:
+            return self.shape_db.names(edition, family)
+        return self.shape_names()[names_edition(edition)][family]
+
+    def get(self, edition, family, section):
+        return self.cache.get(edition, family, section, self.source)
+
+    def get_named(self, edition, family, section):
+        """
+        Properties of one section as a {plain symbol: value} dictionary.
+        """
+        values = self.get(edition, family, section)
+        return dict(zip(family_fields(family), values))
+
+    def table(self, edition, family):
+        """
+        Names and (sections x properties) float array of a whole edition and
+        family.
+        """
+        import numpy as np
+
+        if self.shape_db is not None:
+            return self.shape_db.names(edition, family), np.asarray(self.shape_db.table(edition, family))
+        names = self.section_names(edition, family)
+        return names, self._lookup_values(edition, family, names)
+
+    def batch(self, editions, families, sections, grades=None):
+        """
+        Look up many sections at once. Returns a column dictionary (the
+        layout pandas.DataFrame accepts): the key fields as lists and every
+        property in PROPERTY_FIELDS as a float array, NaN where a property
+        does not apply to the family or the edition, family or section is
+        unknown. With grades the DERIVED_FIELDS are added the same way.
+        """
+        import numpy as np
+
+        count = len(sections)
+        result = {"edition": list(editions), "family": list(families), "section": list(sections)}
+        for field in PROPERTY_FIELDS:
+            result[field] = np.full(count, np.nan)
+
+        # Group rows by table so the shape database is indexed once per table
+        groups = {}
+        for i, key in enumerate(zip(result["edition"], result["family"])):
+            groups.setdefault(key, []).append(i)
+
+        for (edition, family), indices in groups.items():
+            fields = family_fields(family)
+            indices = np.asarray(indices)
+            if self.shape_db is not None:
+                rows = np.array([self._row_index(edition, family, result["section"][i]) for i in indices])
+                found = rows >= 0
+                if not found.any():
+                    # Unknown edition or family, or no known section: the rows stay NaN
+                    continue
+                values = np.asarray(self.shape_db.table(edition, family)[rows[found]])
+                indices = indices[found]
+            else:
+                values = self._lookup_values(edition, family, [result["section"][i] for i in indices])
+            for column, field in enumerate(fields):
+                result[field][indices] = values[:, column]
+
+        if grades is not None:
+            result["grade"] = list(grades)
+            result.update(self.derived.batch(result["edition"], result["family"], result["section"],
+                                             result["grade"], DERIVED_FIELDS))
+        return result
+
+    def _lookup_values(self, edition, family, sections):
+        import numpy as np
+
+        fields = family_fields(family)
+        values = np.full((len(sections), len(fields)), np.nan)
+        for row, section in enumerate(sections):
+            try:
+                section_values = self.get(edition, family, section)[:len(fields)]
+            except (KeyError, ValueError, RuntimeError):
+                # Unknown edition, family or section: the row stays NaN
+                continue
+            values[row, :len(section_values)] = [to_float(value) for value in section_values]
+        return values
+
+    def _row_index(self, edition, family, section):
+        try:
+            return self.shape_db.row_index(edition, family, section)
+        except KeyError:
+            return -1
+
+    def process_rows(self, rows):
+        """
+        Stream {edition, family, section} dictionaries into dictionaries with
+        the key fields followed by PROPERTY_FIELDS, and DERIVED_FIELDS for
+        rows with a grade. Unknown sections and rows missing a key field get
+        an "error" field instead of raising.
+        """
+        for row in rows:
+            output = {field: row.get(field) for field in KEY_FIELDS}
+            edition, family, section = (output[field] for field in KEY_FIELDS)
+            grade = row.get("grade")
+            try:
+                check_key_fields(output, KEY_FIELDS)
+                output.update(self.get_named(edition, family, section))
+                if grade and self.derived is not None:
+                    output["grade"] = grade
+                    output.update(self.derived.get_named(edition, family, section, grade))
+            except (KeyError, ValueError, RuntimeError) as e:
+                output["error"] = str(e) or type(e).__name__
+            yield output
+
+    def iter_family(self, edition, family, grade=None):
+        """
+        Stream the output rows (as process_rows yields them) of every section
+        of an edition and family, for exports.
+        """
+        if grade and self.derived is not None:
+            # One vectorized pass instead of one per section
+            self.derived.family_table(edition, family, grade)
+        return self.process_rows({"edition": edition, "family": family, "section": section, "grade": grade}
+                                 for section in self.section_names(edition, family))
+
+
+def open_section_service():
+    """
+    Return a service backed by the shape database, or by CET_MODULE when the
+    database has not been exported.
+    """
+    shape_db = open_shape_db() if open_shape_db is not None else None
+    if shape_db is not None:
+        return SectionPropertyService(shape_db=shape_db)
+    return SectionPropertyService(cet_module=load_cet_module())
+
+
+def process_rows(rows):
+    """
+    Row processor for batch runs; the service (and its data) is opened once
+    per process.
+    """
+    global _service
+    if _service is None:
+        _service = open_section_service()
+    return _service.process_rows(rows)
+
+
+def format_value(value):
+    # The shape database stores floats, with NaN for missing values
+    if isinstance(value, float):
+        return "" if math.isnan(value) else f"{value:.10g}"
+    return value
@@ -0,0 +1,37 @@
+import os
+import sys
+
+from cet_common.profiling import get_profiler
+
+_cet_module = None
+_import_attempted = False
+
+
+def cet_install_path():
+    """
+    Return the CET.SteelConnDesign installation folder that holds CET_MODULE.
+    """
+    module_path = os.path.join(os.getenv("APPDATA", ""), "CET_SteelConnDesign")
+    if not os.getenv("APPDATA") or not os.path.exists(module_path):
+        module_path = "../"
+    return module_path
+
+
+def load_cet_module():
+    """
+    Import CET_MODULE (CET_MODULE.cp38-win_amd64.pyd) from the installation
+    folder. Returns None when it is not available, e.g. on Linux.
+    """
+    global _cet_module, _import_attempted
+    if not _import_attempted:
+        _import_attempted = True
+        module_path = cet_install_path()
+        if module_path not in sys.path:
+            sys.path.insert(0, module_path)
+        try:
+            with get_profiler().span("import CET_MODULE"):
+                import CET_MODULE
+            _cet_module = CET_MODULE
+        except ImportError as e:
+            print(f"Error importing module: {e}")
+    return _cet_module
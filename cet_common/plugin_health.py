@@ -0,0 +1,163 @@
+"""
+Check plugins in separate worker processes before the host imports them.
+
+Each plugin.py is imported in its own process, all of them concurrently,
+and must define PluginUI. If it also defines a module-level health_check()
+(for example to make sure CET_MODULE or its data can be loaded), that is
+called too. A plugin that raises, crashes its process or does not finish
+within the timeout is reported as broken, so it cannot stall or take down
+the host. At most one worker per CPU runs at a time.
+
+Passing checks are cached in .plugin_health.json, next to the metadata
+cache in the plugin folder and keyed the same way (the mtime and size of
+plugin.py and plugin.json), so only new or changed plugins (and those that
+failed) are checked at the next startup.
+Delete the file to check every plugin again, e.g. after updating CET_MODULE.
+"""
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+
+from cet_common.discovery import SignatureCache, plugin_signature
+
+PLUGINS_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEALTH_CACHE_FILE = ".plugin_health.json"
+
+DEFAULT_TIMEOUT = float(os.getenv("CET_PLUGIN_CHECK_TIMEOUT", "20"))
+
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+
+
+def _check_plugin(plugin_name, plugin_path, plugins_path, connection):
+    start = time.perf_counter()
+    try:
+        if plugins_path not in sys.path:
+            sys.path.append(plugins_path)
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not hasattr(module, "PluginUI"):
+            raise ImportError("plugin.py does not define PluginUI")
+        health_check = getattr(module, "health_check", None)
+        if health_check is not None:
+            health_check()
+        result = {"status": OK, "error": None}
+    except Exception as e:
+        result = {"status": ERROR, "error": f"{type(e).__name__}: {e}"}
+    result["seconds"] = time.perf_counter() - start
+    connection.send(result)
+    connection.close()
+
+
+class HealthCache(SignatureCache):
+    """
+    Passed health checks by plugin_signature.
+    """
+    def passed(self, plugin_path, signature):
+        return self.get(plugin_path, signature) is not None
+
+    def put(self, plugin_path, signature, health):
+        if health["status"] == OK:
+            super().put(plugin_path, signature, OK)
+        else:
+            self.remove(plugin_path)
+
+
+def iter_plugin_health(plugins, timeout=DEFAULT_TIMEOUT, max_workers=None, cache_path=None):
+    """
+    Check the plugins (as returned by scan_plugins) concurrently and yield
+    (name, health) as each finishes. health has "status" (OK, ERROR or
+    TIMEOUT), "error" (a message, or None), "seconds" and "cached" (True
+    for an unchanged plugin that passed before and was not checked again).
+    Pass cache_path="" to check every plugin without the cache.
+    """
+    if cache_path is None and plugins:
+        # Next to the metadata cache, in the folder the plugins were scanned from
+        cache_path = os.path.join(os.path.dirname(os.path.dirname(plugins[0]["path"])), HEALTH_CACHE_FILE)
+    cache = HealthCache(cache_path) if cache_path else None
+
+    waiting = []
+    signatures = {}
+    for plugin in plugins:
+        signatures[plugin["name"]] = plugin_signature(plugin["path"])
+        if cache is not None and cache.passed(plugin["path"], signatures[plugin["name"]]):
+            yield plugin["name"], {"status": OK, "error": None, "seconds": 0.0, "cached": True}
+        else:
+            waiting.append(plugin)
+    if not waiting:
+        return
+
+    try:
+        for plugin, health in _check_all(waiting, timeout, max_workers):
+            health["cached"] = False
+            if cache is not None:
+                cache.put(plugin["path"], signatures[plugin["name"]], health)
+            yield plugin["name"], health
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def _check_all(plugins, timeout, max_workers):
+    context = multiprocessing.get_context("spawn")
+    # Each worker imports PySide2 and CET_MODULE, so no more than one per CPU
+    max_workers = max_workers or max(min(len(plugins), os.cpu_count() or 1), 1)
+    waiting = list(plugins)
+    running = {}  # Parent end of the pipe -> (plugin, process, start)
+
+    while waiting or running:
+        while waiting and len(running) < max_workers:
+            plugin = waiting.pop(0)
+            parent_end, child_end = context.Pipe(duplex=False)
+            process = context.Process(target=_check_plugin, daemon=True,
+                                      args=(plugin["name"], plugin["path"], PLUGINS_PATH, child_end))
+            process.start()
+            # Closed here so the pipe reports EOF if the worker dies
+            child_end.close()
+            running[parent_end] = (plugin, process, time.perf_counter())
+
+        now = time.perf_counter()
+        deadline = min(start + timeout for _, _, start in running.values())
+        for connection in wait(list(running), max(deadline - now, 0)):
+            plugin, process, start = running.pop(connection)
+            try:
+                health = connection.recv()
+            except EOFError:
+                process.join()
+                health = {"status": ERROR, "error": f"Worker process exited with code {process.exitcode}",
+                          "seconds": time.perf_counter() - start}
+            connection.close()
+            process.join()
+            yield plugin, health
+
+        now = time.perf_counter()
+        for connection, (plugin, process, start) in list(running.items()):
+            if now - start >= timeout:
+                del running[connection]
+                process.terminate()
+                process.join()
+                connection.close()
+                yield plugin, {"status": TIMEOUT, "error": f"No response within {timeout:g} s",
+                               "seconds": now - start}
+
+
+def check_plugins(plugins, timeout=DEFAULT_TIMEOUT, max_workers=None, cache_path=None):
+    """
+    Return a copy of the plugins with their "health" added, in the same order.
+    """
+    health = dict(iter_plugin_health(plugins, timeout, max_workers, cache_path))
+    return [dict(plugin, health=health[plugin["name"]]) for plugin in plugins]
+
+
+if __name__ == "__main__":
+    from cet_common.discovery import scan_plugins
+
+    # Run directly, every plugin is checked again
+    for plugin in check_plugins(scan_plugins(PLUGINS_PATH), cache_path=""):
+        health = plugin["health"]
+        print(f"{plugin['name']:30s} {health['status']:8s} {health['seconds']:6.2f} s  {health['error'] or ''}")
@@ -0,0 +1,98 @@
+"""
+Timing spans for the plugin host and plugins.
+
+Spans cost a single flag check while profiling is off. When enabled (by the
+host's --profile option or the CET_PROFILE environment variable) they are
+recorded as Chrome trace events, which chrome://tracing or
+https://ui.perfetto.dev can open, and optionally alongside a cProfile
+capture of the GUI thread.
+"""
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.cprofile = None
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self, cprofile=False):
+        self.enabled = True
+        if cprofile and self.cprofile is None:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    @contextmanager
+    def span(self, name, category="host", **args):
+        """
+        Record the wall time of the enclosed block as a trace event.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter(), category, **args)
+
+    def record(self, name, start, end, category="host", **args):
+        """
+        Record a span measured elsewhere, from perf_counter() start and end.
+        """
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self):
+        """
+        Count, total and maximum milliseconds per span name, slowest total first.
+        """
+        totals = {}
+        with self._lock:
+            for event in self.events:
+                entry = totals.setdefault(event["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+                duration = event["dur"] / 1000
+                entry["count"] += 1
+                entry["total_ms"] += duration
+                entry["max_ms"] = max(entry["max_ms"], duration)
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def export_trace(self, path):
+        with self._lock:
+            events = list(self.events)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def dump_cprofile(self, path):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(path)
+
+
+# Shared by the host and every plugin in the process
+_profiler = Profiler()
+if os.getenv("CET_PROFILE"):
+    _profiler.enable()
+
+
+def get_profiler():
+    return _profiler
@@ -0,0 +1,82 @@
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from cet_common.profiling import get_profiler
+
+
+class _Evaluation(QRunnable):
+    def __init__(self, evaluator, generation, args):
+        super().__init__()
+        self.evaluator = evaluator
+        self.generation = generation
+        self.args = args
+
+    def run(self):
+        try:
+            with get_profiler().span(f"{self.evaluator.name}.evaluate", "plugin"):
+                result, error = self.evaluator.compute(*self.args), None
+        except Exception as e:
+            result, error = None, e
+        # Delivered on the GUI thread through a queued connection
+        try:
+            self.evaluator.finished.emit(self.generation, result, error)
+        except RuntimeError:
+            # The evaluator was deleted with its plugin while this was running
+            pass
+
+
+class CoalescingEvaluator(QObject):
+    """
+    Run compute(*args) on the global QThreadPool and pass its result to
+    render(result) on the GUI thread.
+
+    Requests made in the same event-loop pass (or within delay ms) are merged,
+    at most one evaluation runs at a time, and while it runs only the latest
+    request is kept. A result that is already outdated is not rendered.
+    compute must not touch widgets; read their state before calling request.
+    """
+    finished = Signal(int, object, object)
+
+    def __init__(self, compute, render, delay=0, name="plugin", parent=None):
+        super().__init__(parent)
+        self.name = name  # Prefix of the profiling spans
+        self.compute = compute
+        self.render = render
+        self.generation = 0
+        self.running = False
+        self.pending = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.start_pending)
+        self.finished.connect(self.on_finished)
+
+    def request(self, *args):
+        self.generation += 1
+        self.pending = (self.generation, args)
+        self.timer.start()
+
+    def start_pending(self):
+        if self.running or self.pending is None:
+            return
+        generation, args = self.pending
+        self.pending = None
+        self.running = True
+        QThreadPool.globalInstance().start(_Evaluation(self, generation, args))
+
+    def on_finished(self, generation, result, error):
+        self.running = False
+        if error is not None:
+            print(f"Error evaluating request: {error}")
+        elif generation == self.generation:
+            with get_profiler().span(f"{self.name}.render", "plugin"):
+                self.render(result)
+        self.start_pending()
+
+    def cancel(self):
+        """
+        Drop the pending request and ignore the result of a running one.
+        """
+        self.timer.stop()
+        self.pending = None
+        self.generation += 1
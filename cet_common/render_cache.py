@@ -0,0 +1,11 @@
+from cet_common.lru_cache import LRUCache
+
+
+class RenderCache(LRUCache):
+    """
+    Bounded LRU cache of rendered plugin output (HTML rows, SVG geometry)
+    keyed by the inputs that determine it, so a repeat view costs a
+    dictionary hit. get(key, build) calls build(*key) on a miss.
+    """
+    def __init__(self, maxsize=256):
+        super().__init__(maxsize)
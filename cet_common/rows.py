@@ -0,0 +1,12 @@
+"""
+Checks shared by the row processors (process_rows) of the batch lookups.
+"""
+
+
+def check_key_fields(row, key_fields):
+    """
+    Raise ValueError naming the key fields a row has no value for.
+    """
+    missing = [field for field in key_fields if not row.get(field)]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
@@ -0,0 +1,136 @@
+"""
+Parallel schedule runner for plugins that declare a row_processor.
+
+Input rows are cut into shards and processed by a ProcessPoolExecutor. Each
+worker imports the row processor (and so loads its shape data or tables)
+once, and results are streamed back in input order.
+
+    python -m cet_common.schedule Member_Property members.csv -o properties.csv --workers 8
+"""
+import argparse
+import csv
+import importlib
+import itertools
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cet_common.discovery import scan_plugins
+
+PLUGINS_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_worker_processor = None
+
+
+def find_row_processors(plugin_dir=PLUGINS_PATH):
+    """
+    Map plugin names to the "module:function" row processor they declare.
+    """
+    return {plugin["name"]: plugin["row_processor"]
+            for plugin in scan_plugins(plugin_dir) if plugin.get("row_processor")}
+
+
+def load_row_processor(spec):
+    module_name, _, function_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _init_worker(spec, plugins_path):
+    global _worker_processor
+    if plugins_path not in sys.path:
+        sys.path.append(plugins_path)
+    _worker_processor = load_row_processor(spec)
+
+
+def _process_shard(rows):
+    return list(_worker_processor(rows))
+
+
+def _shards(rows, shard_size):
+    rows = iter(rows)
+    while True:
+        shard = list(itertools.islice(rows, shard_size))
+        if not shard:
+            return
+        yield shard
+
+
+class ScheduleStats:
+    def __init__(self):
+        self.rows = 0
+        self.shards = 0
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+        return f"{self.rows} rows in {self.shards} shards, {self.elapsed:.2f} s ({self.rows_per_second:,.0f} rows/s)"
+
+
+def run_schedule(spec, rows, workers=None, shard_size=1000, stats=None):
+    """
+    Run rows through the row processor spec ("module:function") on a process
+    pool and yield the results in input order. At most two shards per worker
+    are in flight, so inputs of any length are streamed.
+    """
+    if stats is None:
+        stats = ScheduleStats()
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(spec, PLUGINS_PATH)) as executor:
+        pending = deque()
+        for shard in _shards(rows, shard_size):
+            pending.append(executor.submit(_process_shard, shard))
+            if len(pending) >= 2 * workers:
+                yield from _collect(pending.popleft(), stats)
+        while pending:
+            yield from _collect(pending.popleft(), stats)
+
+
+def _collect(future, stats):
+    results = future.result()
+    stats.rows += len(results)
+    stats.shards += 1
+    stats.elapsed = time.perf_counter() - stats.start
+    return results
+
+
+def main(argv=None):
+    processors = find_row_processors()
+    parser = argparse.ArgumentParser(description="Run a schedule CSV through a plugin on all cores.")
+    parser.add_argument("plugin", choices=sorted(processors))
+    parser.add_argument("input", help="Input CSV file")
+    parser.add_argument("-o", "--output", default="-", help="Output CSV file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=1000, help="Rows per shard")
+    args = parser.parse_args(argv)
+
+    spec = processors[args.plugin]
+    module = importlib.import_module(spec.partition(":")[0])
+    fieldnames = getattr(module, "OUTPUT_FIELDS", None)
+
+    stats = ScheduleStats()
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        with open(args.input, newline="", encoding="utf-8") as input_stream:
+            results = run_schedule(spec, csv.DictReader(input_stream), args.workers, args.shard_size, stats)
+            writer = None
+            for row in results:
+                if writer is None:
+                    writer = csv.DictWriter(output_stream, fieldnames=fieldnames or list(row), extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerow(row)
+    finally:
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    print(stats, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from cet_common.lru_cache import LRUCache
+
+
+class SectionCache(LRUCache):
+    """
+    Bounded LRU cache (with optional time-to-live) in front of the native
+    section-property lookups, keyed by (edition, shape family, section).
+    """
+    def __init__(self, maxsize=2048, ttl=None):
+        super().__init__(maxsize, ttl)
+
+    def get(self, edition, family, section, loader):
+        """
+        Return the cached properties, calling loader(edition, family, section)
+        only on a miss or after the entry expired.
+        """
+        return super().get((edition, family, section), lambda *key: tuple(loader(*key)))
+
+    def invalidate(self, edition=None, family=None):
+        """
+        Drop all entries, or only those of an edition and/or family.
+        """
+        super().invalidate(lambda key: (edition is None or key[0] == edition) and (family is None or key[1] == family))
+
+
+# Shared by every plugin imported into the same process
+_shared_cache = SectionCache()
+
+
+def get_section_cache():
+    return _shared_cache
@@ -0,0 +1,67 @@
+import bisect
+
+
+def normalize_section_name(name):
+    """
+    Search key of a section name: lowercase without spaces, so "w14X22" and
+    "W14x22" are the same key.
+    """
+    return "".join(name.split()).lower()
+
+
+def _is_subsequence(text, key):
+    position = 0
+    for char in text:
+        position = key.find(char, position) + 1
+        if position == 0:
+            return False
+    return True
+
+
+class SectionIndex:
+    """
+    Type-ahead index of the section names of one edition and shape family.
+
+    Prefix matches ("W14x") are found by bisecting the sorted keys. If there
+    are fewer than the limit, sections containing the text ("14x22") and then
+    sections containing its characters in order ("w1422") are added.
+    Results keep the order of the section list.
+    """
+    def __init__(self, names):
+        self.names = tuple(names)
+        self.keys = [normalize_section_name(name) for name in self.names]
+        self.rows = {name: row for row, name in enumerate(self.names)}
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self.sorted_keys = [self.keys[row] for row in order]
+        self.sorted_rows = order
+
+    def __len__(self):
+        return len(self.names)
+
+    def row(self, name):
+        """
+        Position of a section in the list, or -1 if it is not in it.
+        """
+        return self.rows.get(name, -1)
+
+    def prefix_rows(self, text):
+        key = normalize_section_name(text)
+        start = bisect.bisect_left(self.sorted_keys, key)
+        end = bisect.bisect_left(self.sorted_keys, key + "\uffff", start)
+        return sorted(self.sorted_rows[start:end])
+
+    def search(self, text, limit=50):
+        key = normalize_section_name(text)
+        if not key:
+            return list(self.names[:limit])
+
+        rows = self.prefix_rows(key)
+        if len(rows) < limit:
+            found = set(rows)
+            contains = [row for row, name_key in enumerate(self.keys) if row not in found and key in name_key]
+            rows += contains
+            if len(rows) < limit:
+                found.update(contains)
+                rows += [row for row, name_key in enumerate(self.keys)
+                         if row not in found and _is_subsequence(key, name_key)]
+        return [self.names[row] for row in rows[:limit]]
@@ -0,0 +1,45 @@
+"""
+Qt list models of the section names, shared by every widget in the process.
+
+A model and a SectionIndex are built once per (edition, family), so a combo
+box switches lists with setModel instead of recreating its items.
+"""
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from cet_common.aisc import names_edition
+from cet_common.section_index import SectionIndex
+
+
+class SectionListModel(QAbstractListModel):
+    def __init__(self, names=(), parent=None):
+        super().__init__(parent)
+        self.names = tuple(names)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.names[index.row()]
+        return None
+
+    def set_names(self, names):
+        self.beginResetModel()
+        self.names = tuple(names)
+        self.endResetModel()
+
+
+_models = {}
+
+
+def section_list_model(shape_names, edition, family):
+    """
+    Return the shared (SectionListModel, SectionIndex) of an edition and
+    family, building them from shape_names (as returned by get_shape_names)
+    on first use.
+    """
+    key = (names_edition(edition), family)
+    if key not in _models:
+        names = shape_names[key[0]][family]
+        _models[key] = (SectionListModel(names), SectionIndex(names))
+    return _models[key]
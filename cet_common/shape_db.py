@@ -0,0 +1,139 @@
+"""
+Columnar AISC shape database exported from CET_MODULE.
+
+Each (edition, shape family) table is stored as a 2-D float64 .npy file
+(one row per section, one column per property) next to an index.json with
+the section names and column symbols. Tables are memory-mapped on first use,
+so opening the database is cheap and a row lookup is a dictionary hit plus
+a slice.
+
+Export once on a machine with CET.SteelConnDesign installed:
+
+    python -m cet_common.shape_db [output folder]
+"""
+import json
+import os
+import sys
+
+import numpy as np
+
+from cet_common.aisc import EDITIONS, FAMILIES, family_columns, names_edition
+from cet_common.units import to_float
+
+INDEX_FILE = "index.json"
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "shape_db")
+
+
+def table_file(edition, family):
+    return f"{edition}_{family}.npy".replace(" ", "_")
+
+
+def export_shape_db(cet_module, db_path=DEFAULT_DB_PATH):
+    """
+    Dump every edition and shape family from CET_MODULE into db_path.
+    """
+    os.makedirs(db_path, exist_ok=True)
+    shape_names = json.loads(cet_module.get_shape_names())
+
+    index = {"version": 1, "tables": {}}
+    for edition in EDITIONS:
+        index["tables"][edition] = {}
+        for family in FAMILIES:
+            names = shape_names[names_edition(edition)][family]
+            columns = family_columns(family)
+            table = np.full((len(names), len(columns)), np.nan)
+            for row, name in enumerate(names):
+                values = cet_module.get_member_section_size(edition, family, name)[:len(columns)]
+                table[row, :len(values)] = [to_float(v) for v in values]
+
+            file_name = table_file(edition, family)
+            np.save(os.path.join(db_path, file_name), table)
+            index["tables"][edition][family] = {
+                "file": file_name,
+                "names": list(names),
+                "columns": columns,
+            }
+
+    with open(os.path.join(db_path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    return index
+
+
+class ShapeDatabase:
+    """
+    Read-only view over an exported shape database.
+    """
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        with open(os.path.join(db_path, INDEX_FILE), "r", encoding="utf-8") as f:
+            self.index = json.load(f)["tables"]
+        self._tables = {}
+        self._rows = {}
+        self._name_arrays = {}
+
+    @staticmethod
+    def exists(db_path=DEFAULT_DB_PATH):
+        return os.path.isfile(os.path.join(db_path, INDEX_FILE))
+
+    def shape_names(self):
+        """
+        Section names in the same layout as json.loads(CET_MODULE.get_shape_names()).
+        """
+        return {edition: {family: entry["names"] for family, entry in families.items()}
+                for edition, families in self.index.items()}
+
+    def names(self, edition, family):
+        return self.index[edition][family]["names"]
+
+    def names_array(self, edition, family):
+        key = (edition, family)
+        if key not in self._name_arrays:
+            self._name_arrays[key] = np.array(self.names(edition, family), dtype=object)
+        return self._name_arrays[key]
+
+    def columns(self, edition, family):
+        return self.index[edition][family]["columns"]
+
+    def table(self, edition, family):
+        """
+        Memory-mapped (sections x properties) array of one edition and family.
+        """
+        key = (edition, family)
+        if key not in self._tables:
+            path = os.path.join(self.db_path, self.index[edition][family]["file"])
+            self._tables[key] = np.load(path, mmap_mode="r")
+        return self._tables[key]
+
+    def row_index(self, edition, family, section):
+        key = (edition, family)
+        if key not in self._rows:
+            self._rows[key] = {name: row for row, name in enumerate(self.names(edition, family))}
+        return self._rows[key][section]
+
+    def get_member_section_size(self, edition, family, section):
+        """
+        Drop-in replacement for CET_MODULE.get_member_section_size.
+        """
+        row = self.table(edition, family)[self.row_index(edition, family, section)]
+        return row.tolist()
+
+
+def open_shape_db(db_path=DEFAULT_DB_PATH):
+    """
+    Return the exported database, or None if it has not been exported.
+    """
+    if ShapeDatabase.exists(db_path):
+        return ShapeDatabase(db_path)
+    return None
+
+
+if __name__ == "__main__":
+    from cet_common.native import load_cet_module
+
+    cet_module = load_cet_module()
+    if cet_module is None:
+        sys.exit("CET_MODULE is required to export the shape database.")
+    db_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH
+    index = export_shape_db(cet_module, db_path)
+    count = sum(len(entry["names"]) for families in index["tables"].values() for entry in families.values())
+    print(f"Exported {count} sections to {db_path}")
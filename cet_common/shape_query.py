@@ -0,0 +1,83 @@
+"""
+Vectorized section search over the exported shape database.
+
+    result = query_sections(db, "AISC 15th", "W-Shapes",
+                            [("Z_x", ">=", 150), ("d", "<=", 24)], order_by="W_t")
+
+Properties are addressed by the symbols in cet_common.aisc.COLUMNS, or by
+their plain form ("Zx", "tfdet", "ybar", "Talpha").
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from cet_common.symbols import plain_symbol
+
+OPERATORS = {
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    ">": np.greater,
+    "<": np.less,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+CONDITION_PATTERN = re.compile(r"^\s*([^<>=!\s]+)\s*(>=|<=|==|!=|>|<)\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*$")
+
+QueryResult = namedtuple("QueryResult", ["names", "rows", "values", "columns"])
+
+
+def column_index(columns, symbol):
+    if symbol in columns:
+        return columns.index(symbol)
+    plain = plain_symbol(symbol)
+    for i, column in enumerate(columns):
+        if plain_symbol(column).lower() == plain.lower():
+            return i
+    raise ValueError(f"Unknown property '{symbol}'. Available: {', '.join(plain_symbol(c) for c in columns)}")
+
+
+def parse_conditions(text):
+    """
+    Parse "Zx >= 150, d <= 24" into [("Zx", ">=", 150.0), ("d", "<=", 24.0)].
+    """
+    conditions = []
+    for part in re.split(r"[,;]|\band\b", text):
+        if not part.strip():
+            continue
+        match = CONDITION_PATTERN.match(part)
+        if match is None:
+            raise ValueError(f"Cannot read condition '{part.strip()}'")
+        symbol, op, value = match.groups()
+        conditions.append((symbol, op, float(value)))
+    return conditions
+
+
+def query_sections(db, edition, family, conditions=(), order_by=None, descending=False, limit=None):
+    """
+    Return the sections of one edition and family matching every
+    (symbol, operator, value) condition, optionally sorted by a property.
+    Sections with a missing (NaN) value never match a condition on it.
+    """
+    table = db.table(edition, family)
+    columns = db.columns(edition, family)
+
+    mask = np.ones(len(table), dtype=bool)
+    for symbol, op, value in conditions:
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}'")
+        column = table[:, column_index(columns, symbol)]
+        # NaN compares unequal to everything, so "!=" has to exclude it explicitly
+        mask &= OPERATORS[op](column, value) & ~np.isnan(column)
+    rows = np.flatnonzero(mask)
+
+    if order_by is not None:
+        keys = table[rows, column_index(columns, order_by)]
+        order = np.argsort(-keys if descending else keys, kind="stable")
+        rows = rows[order]
+    if limit is not None:
+        rows = rows[:limit]
+
+    names = db.names_array(edition, family)[rows]
+    return QueryResult(names, rows, np.asarray(table[rows]), columns)
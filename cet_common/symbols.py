@@ -0,0 +1,75 @@
+"""
+Render the TeX property symbols of cet_common.aisc.COLUMNS as plain HTML.
+
+The symbols only use subscripts, ratios, \\overline and Greek letters, so
+they are rendered once into <i>/<sub> markup instead of typesetting them
+with MathJax in the page. Tables then need no network access and no
+client-side TeX.
+"""
+import html
+import re
+from functools import lru_cache
+
+GREEK = {
+    "\\alpha": "&alpha;",
+    "\\beta": "&beta;",
+    "\\gamma": "&gamma;",
+    "\\lambda": "&lambda;",
+    "\\phi": "&phi;",
+}
+
+OVERLINE = "\\overline{"
+
+# Styles used by the rendered markup, to be included in the page
+SYMBOL_CSS = """
+.symbol { font-family: "Times New Roman", Times, serif; font-size: 1.1em; }
+.symbol sub { font-size: 0.75em; }
+.overline { text-decoration: overline; }
+"""
+
+
+def _render_part(text, subscript):
+    if text.startswith("{") and text.endswith("}"):
+        text = text[1:-1]
+    if text.startswith(OVERLINE) and text.endswith("}"):
+        inner = _render_part(text[len(OVERLINE) - 1:], subscript)
+        return f'<span class="overline">{inner}</span>'
+    if text in GREEK:
+        return GREEK[text]
+
+    pieces = []
+    for piece in text.split(","):
+        piece = html.escape(piece)
+        # Symbols are italic; numbers and descriptive subscripts such as "det" stay upright
+        if not subscript or (len(piece) == 1 and piece.isalpha()):
+            piece = f"<i>{piece}</i>"
+        pieces.append(piece)
+    return ",".join(pieces)
+
+
+def _render_term(symbol):
+    if "_" in symbol and not symbol.startswith("\\"):
+        base, subscript = symbol.split("_", 1)
+        return f"{_render_part(base, False)}<sub>{_render_part(subscript, True)}</sub>"
+    return _render_part(symbol, False)
+
+
+@lru_cache(maxsize=None)
+def render_symbol(symbol):
+    """
+    Return the HTML for a property symbol, e.g. "t_{w,det}" -> t with a
+    "w,det" subscript.
+    """
+    if not symbol:
+        return ""
+    # Ratios such as "b_f/2t_f" are rendered part by part
+    markup = "/".join(_render_term(term) for term in symbol.split("/"))
+    return f'<span class="symbol">{markup}</span>'
+
+
+def plain_symbol(symbol):
+    """
+    Plain form of a TeX property symbol, e.g. "t_{w,det}" -> "twdet".
+    """
+    symbol = re.sub(r"\\overline\{(\w+)\}", r"\1bar", symbol)
+    return re.sub(r"[\\{}_,]", "", symbol)
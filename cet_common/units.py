@@ -0,0 +1,151 @@
+"""
+Parsing and conversion of bolt and hole dimensions such as "1 1/8 in.",
+"22 mm" or "0.8125 x 1.8750".
+
+Single values go through a compiled pattern and a memo table that is
+pre-filled with the common AISC fractions. The array functions (which need
+numpy) parse each distinct string once, so a schedule of 10,000 bolts with
+a handful of sizes costs a few parses and one vectorized conversion.
+"""
+import re
+from fractions import Fraction
+
+MM_PER_INCH = 25.4
+
+# Length unit of each unit system of the plugins
+SYSTEM_UNITS = {"Imperial Units": "in", "Metric Units": "mm"}
+
+# Whole number, decimal, fraction or mixed fraction, with an optional unit
+LENGTH_PATTERN = re.compile(
+    r"^\s*(?:(?P<whole>\d+)[\s-]+(?=\d+/))?(?P<number>\d+(?:\.\d*)?|\.\d+)(?:/(?P<denominator>\d+))?"
+    r"\s*(?P<unit>in\.?|inch(?:es)?|\"|mm)?\s*$",
+    re.IGNORECASE)
+SLOT_SEPARATOR = re.compile(r"\s*[xX×]\s*")
+
+MAX_MEMO_SIZE = 65536
+
+
+def _parse_length(text):
+    match = LENGTH_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Cannot parse the length {text!r}.")
+    value = float(match.group("number"))
+    if match.group("denominator"):
+        if int(match.group("denominator")) == 0:
+            raise ValueError(f"Cannot parse the length {text!r}: zero denominator.")
+        value = float(Fraction(int(match.group("number")), int(match.group("denominator"))))
+    if match.group("whole"):
+        value += int(match.group("whole"))
+    unit = match.group("unit")
+    if unit is not None:
+        unit = "mm" if unit.lower() == "mm" else "in"
+    return value, unit
+
+
+def _common_lengths():
+    """
+    Memo entries of the sixteenths up to 4 in. and the metric bolt sizes.
+    """
+    table = {}
+    for sixteenths in range(1, 4 * 16 + 1):
+        whole, rest = divmod(Fraction(sixteenths, 16), 1)
+        label = " ".join(str(part) for part in (whole, rest) if part)
+        value = float(Fraction(sixteenths, 16))
+        table[label] = (value, None)
+        table[f"{label} in."] = (value, "in")
+    for millimeters in range(10, 101):
+        table[f"{millimeters} mm"] = (float(millimeters), "mm")
+    return table
+
+
+_memo = _common_lengths()
+
+
+def parse_length(text):
+    """
+    Return (value, unit) of a length string, where unit is "in", "mm" or
+    None when the string has no unit. "1 1/8 in." -> (1.125, "in").
+    """
+    result = _memo.get(text)
+    if result is None:
+        result = _parse_length(text)
+        if len(_memo) < MAX_MEMO_SIZE:
+            _memo[text] = result
+    return result
+
+
+def convert_length(value, from_unit, to_unit):
+    """
+    Convert a length (or an array of lengths) between "in" and "mm".
+    """
+    if from_unit == to_unit or from_unit is None or to_unit is None:
+        return value
+    return value * MM_PER_INCH if to_unit == "mm" else value / MM_PER_INCH
+
+
+def parse_slot(text):
+    """
+    Return (width, length) of a slot string such as "0.8125 x 1.8750" or
+    "22 x 50", in the units it is written in.
+    """
+    parts = SLOT_SEPARATOR.split(text.strip())
+    if len(parts) != 2:
+        raise ValueError("The input string does not contain exactly two numbers.")
+    return parse_length(parts[0])[0], parse_length(parts[1])[0]
+
+
+def parse_lengths(texts, unit=None):
+    """
+    Parse an array of length strings into a float array. With unit ("in" or
+    "mm") the values are converted to it; strings without a unit are taken
+    to be in it already. Strings that cannot be parsed give NaN.
+    """
+    import numpy as np
+
+    labels, inverse = np.unique(np.asarray(texts, dtype=str), return_inverse=True)
+    values = np.full(len(labels), np.nan)
+    scales = np.ones(len(labels))
+    for i, label in enumerate(labels.tolist()):
+        try:
+            values[i], label_unit = parse_length(label)
+        except ValueError:
+            continue
+        scales[i] = convert_length(1.0, label_unit, unit)
+    return (values * scales)[inverse].reshape(np.shape(texts))
+
+
+def parse_slots(texts):
+    """
+    Parse an array of hole dimension strings into width and length float
+    arrays. Round holes and strings that cannot be parsed give NaN.
+    """
+    import numpy as np
+
+    labels, inverse = np.unique(np.asarray(texts, dtype=str), return_inverse=True)
+    slots = np.full((len(labels), 2), np.nan)
+    for i, label in enumerate(labels.tolist()):
+        try:
+            slots[i] = parse_slot(label)
+        except ValueError:
+            continue
+    shape = np.shape(texts)
+    return slots[inverse, 0].reshape(shape), slots[inverse, 1].reshape(shape)
+
+
+def extract_and_format_dimensions(dim_string):
+    # Slot width and length rounded to four decimals
+    slot_width, slot_length = parse_slot(dim_string)
+    return float(f"{slot_width:.4f}"), float(f"{slot_length:.4f}")
+
+
+def fraction_to_decimal(fraction_str):
+    # The numeric value of a length such as "1 1/8 in.", "3/4 in." or "36 mm", without its unit
+    return parse_length(fraction_str)[0]
+
+
+def to_float(value):
+    # A section property or other value from CET_MODULE as a float; non-numeric text such as "–" is NaN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
@@ -0,0 +1,92 @@
+import json
+import time
+
+from PySide2.QtCore import Signal
+from PySide2.QtWidgets import QVBoxLayout, QWidget
+
+from cet_common.profiling import get_profiler
+
+
+class PageBridge:
+    """
+    Load a page template into a web view once and send later updates
+    as JavaScript calls, so a new selection patches the page in place
+    instead of reloading it with setHtml.
+    """
+    def __init__(self, web_view, html):
+        self.web_view = web_view
+        self.loaded = False
+        self.pending = {}  # Latest script per function, sent once the page is loaded
+        self.web_view.loadFinished.connect(self.on_load_finished)
+        self.load_started = time.perf_counter()
+        self.web_view.setHtml(html)
+
+    def call(self, function, *args):
+        """
+        Call a JavaScript function of the page with JSON-encoded arguments.
+        Calls made before the page is loaded are coalesced per function and
+        replayed in the order of their latest call.
+        """
+        script = f"{function}({', '.join(json.dumps(arg) for arg in args)});"
+        if self.loaded:
+            self.web_view.page().runJavaScript(script)
+        else:
+            # Re-inserted so a later call is also replayed after the calls made before it
+            self.pending.pop(function, None)
+            self.pending[function] = script
+
+    def on_load_finished(self, ok):
+        # Measured from setHtml, so it includes the wait for a lazily created view
+        get_profiler().record("page load", self.load_started, time.perf_counter(), "render", ok=ok)
+        self.loaded = True
+        for script in self.pending.values():
+            self.web_view.page().runJavaScript(script)
+        self.pending.clear()
+
+
+class LazyWebView(QWidget):
+    """
+    Stand-in for QWebEngineView that only imports QtWebEngine and creates the
+    view (starting the Chromium render process) the first time it is shown.
+    Hidden plugins in the host's stacked widget never start a web engine.
+    """
+    loadFinished = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.view = None
+        self.html = None
+        self.view_layout = QVBoxLayout(self)
+        self.view_layout.setContentsMargins(0, 0, 0, 0)
+
+    def setHtml(self, html):
+        self.html = html
+        if self.view is not None:
+            self.view.setHtml(html)
+
+    def page(self):
+        return self.view.page()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.view is None:
+            self.create_view()
+
+    def create_view(self):
+        with get_profiler().span("create web view", "render"):
+            from PySide2.QtWebEngineWidgets import QWebEngineView
+
+            self.view = QWebEngineView(self)
+        self.view.loadFinished.connect(self.loadFinished)
+        self.view_layout.addWidget(self.view)
+        if self.html is not None:
+            self.view.setHtml(self.html)
+
+    def release(self):
+        """
+        Delete the web view and its page. It is created again when next shown.
+        """
+        if self.view is not None:
+            self.view_layout.removeWidget(self.view)
+            self.view.deleteLater()
+            self.view = None
@@ -1,18 +1,55 @@
 import os
 import sys
+import argparse
 import importlib.util
+import threading
+import time
+from collections import OrderedDict
 from PySide2.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget,
                              QComboBox, QStackedWidget, QFormLayout, QLabel, QHBoxLayout)
 
-from PySide2.QtCore import QCoreApplication, Qt
-from PySide2.QtWebEngine import QtWebEngine
+from PySide2.QtCore import QCoreApplication, Qt, Signal
 
-# Ensure proper initialization of QtWebEngine
+from cet_common.discovery import scan_plugins
+from cet_common.plugin_health import ERROR, OK, iter_plugin_health
+from cet_common.profiling import get_profiler
+
+# QtWebEngine is started lazily by the plugins that need it; it only
+# requires shared OpenGL contexts to be enabled before QApplication exists
 QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
-QtWebEngine.initialize()
+
+# Optional, for the per-plugin memory figure
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Number of plugin UIs kept alive; the least recently used one beyond this is unloaded
+MAX_PLUGIN_WIDGETS = int(os.getenv("CET_MAX_PLUGIN_WIDGETS", "4"))
+
+
+def process_memory():
+    """
+    Resident memory of this process and its children (the web engine
+    render processes), in bytes, or None without psutil.
+    """
+    if psutil is None:
+        return None
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Health of one plugin, reported from the checking thread
+    plugin_checked = Signal(str, object)
+
+    def __init__(self, max_plugin_widgets=MAX_PLUGIN_WIDGETS, check_plugins=True):
         super().__init__()
         self.setWindowTitle("CET.SteelConnDesign Plugins")
         self.setGeometry(100, 100, 800, 600)
@@ -48,10 +85,23 @@ class MainWindow(QMainWindow):
         
         self.main_layout.addWidget(self.content_widget)
 
+        # Status bar with the memory taken by the last loaded plugin
+        self.memory_label = QLabel()
+        self.statusBar().addPermanentWidget(self.memory_label)
+
         # Plugin dictionaries
-        self.plugin_widgets = {}  # Stores plugin name to plugin UI mapping
+        self.plugin_widgets = OrderedDict()  # Stores plugin name to plugin UI mapping, least recently used first
+        self.plugin_states = {}   # Stores the last state of unloaded plugins
+        self.plugin_memory = {}   # Stores the memory (bytes) each plugin took when loaded
+        self.memory_baselines = {}  # Memory before loading, for plugins whose page has not loaded yet
+        self.max_plugin_widgets = max(1, max_plugin_widgets)
+        self.plugin_modules = {}  # Stores plugin name to imported module mapping
         self.plugin_paths = {}    # Stores plugin name to plugin path mapping
         self.plugin_info = []     # Stores plugin metadata (for sorting)
+        self.plugin_health = {}   # Stores plugin name to health check result mapping
+        self.requested_plugin = None  # Plugin selected before its health check finished
+        self.check_plugins = check_plugins
+        self.plugin_checked.connect(self.on_plugin_checked)
         
         # Preload plugin paths
         plugin_dir = "./"
@@ -61,31 +111,71 @@ class MainWindow(QMainWindow):
     def scan_plugins(self, plugin_dir):
         """
         Scan the plugin directory and record plugin paths.
+        Metadata is read statically, so no plugin is imported here.
         """
-        for plugin_name in os.listdir(plugin_dir):
-            plugin_path = os.path.join(plugin_dir, plugin_name, "plugin.py")
-            if os.path.isfile(plugin_path):
-                # Record plugin path
-                self.plugin_paths[plugin_name] = plugin_path
-                # Preload plugin metadata
-                spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                # Check for required metadata
-                if hasattr(module, "description") and hasattr(module, "category") and hasattr(module, "load_order"):
-                    self.plugin_info.append({
-                        "name": plugin_name,
-                        "path": plugin_path,
-                        "description": module.description,
-                        "category": module.category,
-                        "load_order": module.load_order
-                    })
-                    
-        # Sort plugins by load order
-        self.plugin_info.sort(key=lambda x: x["load_order"])
+        with get_profiler().span("scan_plugins", plugin_dir=plugin_dir):
+            self.plugin_info = scan_plugins(plugin_dir)
+        for plugin in self.plugin_info:
+            self.plugin_paths[plugin["name"]] = plugin["path"]
+            if not self.check_plugins:
+                self.plugin_health[plugin["name"]] = {"status": OK, "error": None, "seconds": 0.0}
         # Add plugin names to the dropdown menu
         for plugin in self.plugin_info:
             self.plugin_dropdown.addItem(plugin["name"])
+        # Plugins are imported in worker processes first, so a broken one cannot stall or crash the host
+        if self.check_plugins:
+            threading.Thread(target=self.check_plugin_health, args=(list(self.plugin_info),), daemon=True).start()
+
+    def check_plugin_health(self, plugins):
+        """
+        Runs on a background thread; the results are delivered to the GUI thread.
+        """
+        checked = set()
+        try:
+            for plugin_name, health in iter_plugin_health(plugins):
+                end = time.perf_counter()
+                get_profiler().record(f"check {plugin_name}", end - health["seconds"], end,
+                                      plugin=plugin_name, status=health["status"])
+                checked.add(plugin_name)
+                self.plugin_checked.emit(plugin_name, health)
+        except Exception as e:
+            # Without worker processes the plugins are still loaded, guarded by load_and_show_plugin
+            print(f"Error checking plugins: {e}")
+            for plugin in plugins:
+                if plugin["name"] not in checked:
+                    self.plugin_checked.emit(plugin["name"], {"status": OK, "error": None, "seconds": 0.0})
+
+    def on_plugin_checked(self, plugin_name, health):
+        self.plugin_health[plugin_name] = health
+        if health["status"] != OK:
+            self.disable_plugin(plugin_name, health)
+        if plugin_name == self.requested_plugin:
+            self.requested_plugin = None
+            if self.plugin_dropdown.currentText() == plugin_name:
+                self.load_and_show_plugin(plugin_name)
+
+    def disable_plugin(self, plugin_name, health):
+        """
+        Show a broken plugin as a disabled dropdown entry with the error as its tooltip.
+        """
+        self.plugin_health[plugin_name] = health
+        row = self.plugin_dropdown.findText(plugin_name)
+        item = self.plugin_dropdown.model().item(row)
+        if item is not None:
+            item.setEnabled(False)
+            item.setToolTip(f"Unavailable ({health['status']}): {health['error']}")
+
+    def import_plugin(self, plugin_name, plugin_path):
+        """
+        Import plugin.py once, on first selection.
+        """
+        if plugin_name not in self.plugin_modules:
+            with get_profiler().span(f"import {plugin_name}", plugin=plugin_name):
+                spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            self.plugin_modules[plugin_name] = module
+        return self.plugin_modules[plugin_name]
 
     def load_and_show_plugin(self, plugin_name):
         """
@@ -93,25 +183,121 @@ class MainWindow(QMainWindow):
         """
         if plugin_name in self.plugin_widgets:
             # Plugin already loaded, show it
+            self.plugin_widgets.move_to_end(plugin_name)
             self.plugin_container.setCurrentWidget(self.plugin_widgets[plugin_name])
         else:
+            health = self.plugin_health.get(plugin_name)
+            if health is None:
+                # Loaded once its health check reports back
+                self.requested_plugin = plugin_name
+                self.statusBar().showMessage(f"Checking {plugin_name}...")
+                return
+            if health["status"] != OK:
+                self.statusBar().showMessage(f"{plugin_name} is unavailable: {health['error']}")
+                return
+            self.statusBar().clearMessage()
+
             # Find plugin metadata
             plugin_data = next((p for p in self.plugin_info if p["name"] == plugin_name), None)
             if plugin_data:
-                # Dynamically load the plugin
-                plugin_path = plugin_data["path"]
-                spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                # Check if PluginUI class is defined
-                if hasattr(module, "PluginUI"):
-                    plugin_widget = module.PluginUI()
-                    self.plugin_widgets[plugin_name] = plugin_widget
-                    self.plugin_container.addWidget(plugin_widget)
-                    self.plugin_container.setCurrentWidget(plugin_widget)
+                memory_before = process_memory()
+                try:
+                    # Dynamically load the plugin
+                    module = self.import_plugin(plugin_name, plugin_data["path"])
+                    # Check if PluginUI class is defined
+                    if not hasattr(module, "PluginUI"):
+                        raise ImportError("plugin.py does not define PluginUI")
+                    with get_profiler().span(f"construct {plugin_name}", plugin=plugin_name):
+                        plugin_widget = module.PluginUI()
+                except Exception as e:
+                    self.disable_plugin(plugin_name, {"status": ERROR, "error": f"{type(e).__name__}: {e}"})
+                    self.statusBar().showMessage(f"{plugin_name} is unavailable: {type(e).__name__}: {e}")
+                    return
+                # Return a reloaded plugin to its last selection
+                if plugin_name in self.plugin_states and hasattr(plugin_widget, "restore_state"):
+                    plugin_widget.restore_state(self.plugin_states.pop(plugin_name))
+                self.plugin_widgets[plugin_name] = plugin_widget
+                self.plugin_container.addWidget(plugin_widget)
+                self.plugin_container.setCurrentWidget(plugin_widget)
+                self.evict_plugins()
+
+                if memory_before is not None:
+                    self.plugin_memory[plugin_name] = process_memory() - memory_before
+                    # The web engine starts its render process only after the view is first
+                    # shown, so sample again once the page has loaded
+                    web_view = getattr(plugin_widget, "web_view", None)
+                    if web_view is not None and hasattr(web_view, "loadFinished"):
+                        self.memory_baselines[plugin_name] = memory_before
+                        web_view.loadFinished.connect(
+                            lambda ok, name=plugin_name: self.on_plugin_page_loaded(name))
+        self.show_plugin_memory(plugin_name)
+
+    def on_plugin_page_loaded(self, plugin_name):
+        # Only the first load after the plugin was loaded; reloads of the page are ignored
+        memory_before = self.memory_baselines.pop(plugin_name, None)
+        if memory_before is None:
+            return
+        self.plugin_memory[plugin_name] = process_memory() - memory_before
+        if self.plugin_container.currentWidget() is self.plugin_widgets.get(plugin_name):
+            self.show_plugin_memory(plugin_name)
+
+    def evict_plugins(self):
+        """
+        Unload the least recently used plugins beyond max_plugin_widgets.
+        """
+        while len(self.plugin_widgets) > self.max_plugin_widgets:
+            self.unload_plugin(next(iter(self.plugin_widgets)))
+
+    def unload_plugin(self, plugin_name):
+        """
+        Save the plugin state, tear down its UI (and web view) and free it.
+        """
+        plugin_widget = self.plugin_widgets.pop(plugin_name, None)
+        if plugin_widget is None:
+            return
+        self.memory_baselines.pop(plugin_name, None)
+        if hasattr(plugin_widget, "save_state"):
+            self.plugin_states[plugin_name] = plugin_widget.save_state()
+        if hasattr(plugin_widget, "teardown"):
+            plugin_widget.teardown()
+        self.plugin_container.removeWidget(plugin_widget)
+        plugin_widget.deleteLater()
+
+    def show_plugin_memory(self, plugin_name):
+        memory = self.plugin_memory.get(plugin_name)
+        if memory is None:
+            self.memory_label.setText("")
+        else:
+            self.memory_label.setText(f"{plugin_name}: {memory / 2**20:+.1f} MB when loaded, "
+                                      f"{len(self.plugin_widgets)}/{self.max_plugin_widgets} plugins loaded")
+
+def write_profile(args):
+    """
+    Export the recorded spans (and cProfile capture) and print a summary.
+    """
+    profiler = get_profiler()
+    if args.profile:
+        profiler.export_trace(args.profile)
+    if args.cprofile:
+        profiler.dump_cprofile(args.cprofile)
+    for name, entry in profiler.summary().items():
+        print(f"{name:40s} {entry['count']:6d} x  total {entry['total_ms']:9.1f} ms  max {entry['max_ms']:8.1f} ms")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    main_window = MainWindow()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", metavar="TRACE_JSON", default=os.getenv("CET_PROFILE"),
+                        help="Record timing spans and export them as a Chrome trace")
+    parser.add_argument("--cprofile", metavar="PROF_FILE", help="Also capture the GUI thread with cProfile")
+    parser.add_argument("--no-plugin-check", action="store_true",
+                        help="Load plugins without checking them in worker processes first")
+    args, qt_args = parser.parse_known_args()
+    if args.profile or args.cprofile:
+        get_profiler().enable(cprofile=bool(args.cprofile))
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    main_window = MainWindow(check_plugins=not args.no_plugin_check)
     main_window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    exit_code = app.exec_()
+    if get_profiler().enabled:
+        write_profile(args)
+    sys.exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,51 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cet_common.derived_properties import _rectangular_hss, _w_shape, derived_values  # noqa: E402
+
+# AISC Manual 15th edition Table 1-1, W14x22
+W14X22 = {"A": 6.49, "d": 13.7, "tw": 0.230, "bf": 5.00, "tf": 0.335, "kdes": 0.735, "Sx": 29.0, "Zx": 33.2,
+          "ry": 1.04, "Iy": 7.00, "J": 0.208, "Cw": 314.0}
+
+# AISC Manual 15th edition Table 1-11, HSS8x4x1/4
+HSS8X4X1_4 = {"tdes": 0.233, "A": 5.24, "Sx": 10.6, "Zx": 13.1, "ry": 1.61, "J": 34.1, "B": 4.0, "Ht": 8.0}
+
+
+def _properties(section):
+    return {name: np.array([value]) for name, value in section.items()}
+
+
+def test_w_shape():
+    # Fy = 50 ksi; hand-computed values
+    values = {symbol: value[0] for symbol, value in _w_shape(_properties(W14X22), 50.0).items()}
+    assert values["P_y"] == pytest.approx(324.5)  # 50 x 6.49
+    assert values["M_p"] == pytest.approx(138.33, rel=1e-4)  # 50 x 33.2 / 12
+    assert values["M_y"] == pytest.approx(120.83, rel=1e-4)  # 50 x 29.0 / 12
+    assert values["b_f/2t_f"] == pytest.approx(7.463, rel=1e-3)  # 5.00 / (2 x 0.335)
+    assert values["h/t_w"] == pytest.approx(53.17, rel=1e-3)  # (13.7 - 2 x 0.735) / 0.230
+    # F2-5: 1.76 x 1.04 x sqrt(29000 / 50) / 12; Manual Table 3-2 gives 3.67 ft
+    assert values["L_p"] == pytest.approx(3.673, rel=1e-3)
+    # F2-6 with rts = 1.271 in., ho = 13.37 in., c = 1; Manual Table 3-2 gives 10.4 ft
+    assert values["L_r"] == pytest.approx(10.44, rel=1e-3)
+
+
+def test_rectangular_hss():
+    # Fy = 50 ksi; hand-computed values
+    values = {symbol: value[0] for symbol, value in _rectangular_hss(_properties(HSS8X4X1_4), 50.0).items()}
+    assert values["P_y"] == pytest.approx(262.0)  # 50 x 5.24
+    assert values["M_p"] == pytest.approx(54.58, rel=1e-3)  # 50 x 13.1 / 12
+    assert values["M_y"] == pytest.approx(44.17, rel=1e-3)  # 50 x 10.6 / 12
+    assert values["b/t"] == pytest.approx(14.17, rel=1e-3)  # (4 - 3 x 0.233) / 0.233, Manual 14.2
+    assert values["h/t"] == pytest.approx(31.33, rel=1e-3)  # (8 - 3 x 0.233) / 0.233, Manual 31.3
+    # F7-12: 0.13 x 29000 x 1.61 x sqrt(34.1 x 5.24) / (50 x 13.1) / 12
+    assert values["L_p"] == pytest.approx(10.32, rel=1e-3)
+    # F7-13: 2 x 29000 x 1.61 x sqrt(34.1 x 5.24) / (0.7 x 50 x 10.6) / 12
+    assert values["L_r"] == pytest.approx(280.4, rel=1e-3)
+
+
+def test_derived_values_missing_properties():
+    row = np.full(25, np.nan)
+    assert np.isnan(derived_values("W-Shapes", row, "A36")).all()
+    with pytest.raises(KeyError):
+        derived_values("W-Shapes", row, "A7")
@@ -0,0 +1,45 @@
+import json
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cet_common.aisc import family_columns  # noqa: E402
+from cet_common.shape_db import INDEX_FILE, ShapeDatabase, table_file  # noqa: E402
+from cet_common.shape_query import OPERATORS, query_sections  # noqa: E402
+
+EDITION = "AISC 15th"
+FAMILY = "W-Shapes"
+# Z_x of each section; W8X10 has no value, as for a "–" from CET_MODULE
+SECTIONS = {"W8X10": np.nan, "W8X13": 11.4, "W8X15": 13.6, "W8X18": 17.0}
+
+
+@pytest.fixture
+def db(tmp_path):
+    columns = family_columns(FAMILY)
+    table = np.ones((len(SECTIONS), len(columns)))
+    table[:, columns.index("Z_x")] = list(SECTIONS.values())
+    np.save(os.path.join(tmp_path, table_file(EDITION, FAMILY)), table)
+    index = {"version": 1, "tables": {EDITION: {FAMILY: {"file": table_file(EDITION, FAMILY),
+                                                         "names": list(SECTIONS), "columns": columns}}}}
+    with open(os.path.join(tmp_path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    return ShapeDatabase(str(tmp_path))
+
+
+@pytest.mark.parametrize("op", sorted(OPERATORS))
+def test_nan_never_matches(db, op):
+    names = query_sections(db, EDITION, FAMILY, [("Zx", op, 13.6)]).names.tolist()
+    expected = [name for name, zx in SECTIONS.items() if not np.isnan(zx) and OPERATORS[op](zx, 13.6)]
+    assert names == expected
+    assert "W8X10" not in names
+
+
+@pytest.mark.parametrize("descending, expected", [
+    (False, ["W8X13", "W8X15", "W8X18", "W8X10"]),
+    (True, ["W8X18", "W8X15", "W8X13", "W8X10"]),
+])
+def test_nan_sorts_last(db, descending, expected):
+    result = query_sections(db, EDITION, FAMILY, order_by="Zx", descending=descending)
+    assert result.names.tolist() == expected
@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+from cet_common.units import parse_length, parse_lengths, parse_slot, parse_slots
+
+MALFORMED = ["3/0 in.", "0/0", "1 1/0 in.", "", "abc", "1.5/2 in.", "22 cm", "1//2"]
+
+
+def test_parse_length():
+    assert parse_length("1 1/8 in.") == (1.125, "in")
+    assert parse_length("3/4") == (0.75, None)
+    assert parse_length("22 mm") == (22.0, "mm")
+
+
+@pytest.mark.parametrize("text", MALFORMED)
+def test_parse_length_malformed(text):
+    with pytest.raises(ValueError):
+        parse_length(text)
+
+
+@pytest.mark.parametrize("text", ["0.8125 x 0/0", "1 x 2 x 3", "22"])
+def test_parse_slot_malformed(text):
+    with pytest.raises(ValueError):
+        parse_slot(text)
+
+
+def test_parse_lengths_malformed_give_nan():
+    pytest.importorskip("numpy")
+    values = parse_lengths(["1 in."] + MALFORMED + ["22 mm"], unit="mm")
+    assert values[0] == 25.4
+    assert all(math.isnan(value) for value in values[1:-1])
+    assert values[-1] == 22.0
+
+
+def test_parse_slots_malformed_give_nan():
+    pytest.importorskip("numpy")
+    widths, lengths = parse_slots(["0.8125 x 1.8750", "3/0 x 1", "0.8125"])
+    assert (widths[0], lengths[0]) == (0.8125, 1.875)
+    assert all(math.isnan(value) for value in widths[1:])
+    assert all(math.isnan(value) for value in lengths[1:])